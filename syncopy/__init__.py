@@ -6,24 +6,68 @@
 # Builtin/3rd party package imports
 import os
 import sys
+import json
+import functools
 import subprocess
+import importlib
+import importlib.util
 import getpass
 import socket
 import numpy as np
 from hashlib import blake2b, sha1
 from importlib.metadata import version, PackageNotFoundError
-import dask.distributed as dd
 
 # Get package version: either via meta-information from egg or via latest git commit
-try:
-    __version__ = version("esi-syncopy")
-except PackageNotFoundError:
+def _git_cache_key(repoDir):
+    """
+    Build cache key from (mtime, size) of `.git/HEAD`, the checked out branch ref
+    and all tag refs (loose and packed), as `git describe --tags` depends on all of them
+    """
+    gitDir = os.path.join(repoDir, ".git")
+    headFile = os.path.join(gitDir, "HEAD")
+    try:
+        paths = [headFile, os.path.join(gitDir, "packed-refs")]
+        with open(headFile, "r") as head:
+            ref = head.read().strip()
+        if ref.startswith("ref:"):
+            paths.append(os.path.join(gitDir, *ref[4:].strip().split("/")))
+        # new, deleted or moved (re-written) loose tags show up in the stats of
+        # the tag files and/or the mtimes of their directories
+        for root, dirs, files in os.walk(os.path.join(gitDir, "refs", "tags")):
+            dirs.sort()
+            paths.append(root)
+            paths += [os.path.join(root, fle) for fle in sorted(files)]
+        stats = [os.stat(path) for path in paths if os.path.exists(path)]
+    except OSError:
+        return None
+    keyStr = "|".join([repoDir] + [f"{st.st_mtime_ns}:{st.st_size}" for st in stats])
+    return sha1(keyStr.encode()).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_version():
+    """Query git for the package version, re-using a previously cached result if HEAD did not move"""
+
+    repoDir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    cacheFile = os.path.join(os.path.expanduser("~"), ".spy", "version_cache.json")
+    cacheKey = _git_cache_key(repoDir)
+    cache = {}
+    if cacheKey is not None:
+        try:
+            with open(cacheFile, "r") as fid:
+                cache = json.load(fid)
+            if cacheKey in cache:
+                return cache[cacheKey]
+        except (OSError, ValueError):
+            cache = {}
+
     proc = subprocess.Popen(
         "git describe --tags",
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True,
         shell=True,
+        cwd=repoDir,
     )
     out, err = proc.communicate()
     if proc.returncode != 0:
@@ -33,6 +77,7 @@ except PackageNotFoundError:
             stderr=subprocess.PIPE,
             text=True,
             shell=True,
+            cwd=repoDir,
         )
         out, err = proc.communicate()
         if proc.returncode != 0:
@@ -41,20 +86,59 @@ except PackageNotFoundError:
                 + "Please consider obtaining SyNCoPy sources from supported channels. "
             )
             print(msg)
-            out = "-999"
-    __version__ = out.rstrip("\n")
+            return "-999"
+    gitVersion = out.rstrip("\n")
+
+    # Only keep the most recent entry around, stale keys are never hit again
+    if cacheKey is not None:
+        try:
+            os.makedirs(os.path.dirname(cacheFile), exist_ok=True)
+            with open(cacheFile, "w") as fid:
+                json.dump({cacheKey: gitVersion}, fid)
+        except OSError:
+            pass
+    return gitVersion
+
+
+try:
+    __version__ = version("esi-syncopy")
+except PackageNotFoundError:
+    __version__ = _resolve_version()
 
 # --- Greeting ---
 
+# Set by `_client_running` upon first call
+_client_checked = False
+_client_found = False
+
+
+def _client_running():
+    """Check (only once) if a dask client is around, i.e., we are being imported by a worker"""
+    global _client_checked, _client_found
+    if not _client_checked:
+        try:
+            from dask.distributed import get_client
+
+            get_client()
+            _client_found = True
+        except (ImportError, ValueError):
+            _client_found = False
+        _client_checked = True
+    return _client_found
+
+
+# Startup messages can be silenced via env variable or sentinel file (checked only once)
+_SILENT = os.getenv("SPYSILENTSTARTUP") is not None or os.path.isfile(
+    os.path.join(os.path.expanduser("~"), ".spy", "silentstartup")
+)
+
 
 def startup_print_once(message, force=False):
     """Print message once: do not spam message n times during all n worker imports."""
-    try:
-        dd.get_client()
-    except ValueError:
-        silence_file = os.path.join(os.path.expanduser("~"), ".spy", "silentstartup")
-        if force or (os.getenv("SPYSILENTSTARTUP") is None and not os.path.isfile(silence_file)):
-            print(message)
+    if _SILENT and not force:
+        return
+    if not _client_running():
+        print(message)
 
 
 msg = f"""
@@ -87,30 +171,15 @@ except ImportError:
             + "\tpip install esi-acme"
         )
         # do not spam via worker imports
-        try:
-            dd.get_client()
-        except ValueError:
+        if not _client_running():
             print(msg)
 
-# (Try to) set up visualization environment
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.style as mplstyle
-    import matplotlib as mpl
-
-    __plt__ = True
-except ImportError:
-    __plt__ = False
-
-try:
-    import pynwb
-
-    __pynwb__ = True
-except ImportError:
-    __pynwb__ = False
+# Check if visualization/NWB environment is available: the (heavy) actual imports
+# are only performed by the routines that need them
+__plt__ = importlib.util.find_spec("matplotlib") is not None
+__pynwb__ = importlib.util.find_spec("pynwb") is not None
 
-# Set package-wide temp directory
-csHome = "/cs/home/{}".format(getpass.getuser())
+# Set package-wide temp directory (only look up the user name if we have to)
 if os.environ.get("SPYDIR"):
     __spydir__ = os.path.abspath(os.path.expanduser(os.environ["SPYDIR"]))
     if not os.path.exists(__spydir__):
@@ -118,6 +187,7 @@ if os.environ.get("SPYDIR"):
             f"Environment variable SPYDIR set to non-existent or unreadable directory '{__spydir__}'. Please unset SPYDIR or create the directory."
         )
 else:
+    csHome = "/cs/home/{}".format(getpass.getuser())
     if os.path.exists(csHome):  # ESI cluster.
         __spydir__ = os.path.join(csHome, ".spy")
     else:
@@ -149,13 +219,34 @@ from . import shared, io, datatype
 from .shared import *
 from .io import *
 from .datatype import *
-from .specest import *
-from .connectivity import *
-from .statistics import *
-from .plotting import *
-from .preproc import *
 from .synthdata import *
 
+# Analysis and plotting sub-packages are only imported upon first access of
+# one of their public names (PEP 562)
+_submodules = {
+    "specest": ["freqanalysis"],
+    "connectivity": ["connectivityanalysis"],
+    "statistics": ["spike_psth", "timelockanalysis", "mean", "std", "var", "median", "itc"],
+    "plotting": ["singlepanelplot", "multipanelplot"],
+    "preproc": ["preprocessing", "resampledata"],
+}
+_lazy_names = {name: submod for submod, names in _submodules.items() for name in names}
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module("." + name, __name__)
+    if name in _lazy_names:
+        attr = getattr(importlib.import_module("." + _lazy_names[name], __name__), name)
+        globals()[name] = attr
+        return attr
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_submodules) | set(_lazy_names))
+
+
 from .datatype.util import setup_storage, get_dir_size
 
 (
@@ -220,8 +311,5 @@ __all__ = []
 __all__.extend(datatype.__all__)
 __all__.extend(io.__all__)
 __all__.extend(shared.__all__)
-__all__.extend(specest.__all__)
-__all__.extend(connectivity.__all__)
-__all__.extend(statistics.__all__)
-__all__.extend(plotting.__all__)
-__all__.extend(preproc.__all__)
+for _names in _submodules.values():
+    __all__.extend(_names)
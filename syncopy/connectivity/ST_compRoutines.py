@@ -8,7 +8,8 @@
 # Builtin/3rd party package imports
 import numpy as np
 import h5py
-from scipy.signal import fftconvolve, detrend
+from scipy.signal import detrend
+from scipy.fft import rfft, irfft, next_fast_len
 from inspect import signature
 from hashlib import blake2b
 
@@ -385,7 +386,9 @@ def cross_spectra_cF(
 
     freqs = np.fft.rfftfreq(nSamples, 1 / samplerate)
 
-    if foi is not None:
+    # the default `foi` are all attainable frequencies: in this case
+    # skip the matching and use a (non-copying) slice on the result
+    if foi is not None and not (foi.size == freqs.size and np.array_equal(foi, freqs)):
         _, freq_idx = best_match(freqs, foi, squash_duplicates=True)
         nFreq = freq_idx.size
     else:
@@ -562,15 +565,23 @@ def cross_covariance_cF(
     # re-normalize output for different effective overlaps
     norm_overlap = np.arange(nSamples, nSamples // 2, step=-1)
 
+    # the spectra of all channels and their time-reversals get
+    # computed only once and re-used for all channel pairs
+    nFFT = next_fast_len(2 * nSamples - 1)
+    fwd = rfft(dat, n=nFFT, axis=0)
+    rev = rfft(dat[::-1], n=nFFT, axis=0)
+    # 'same' mode w.r.t. the full linear cross-correlation
+    start = (nSamples - 1) // 2
+    norm_overlap = norm_overlap[:, None]
+
     CC = np.empty(outShape)
     for i in range(nChannels):
-        for j in range(i + 1):
-            cc12 = fftconvolve(dat[:, i], dat[::-1, j], mode="same")
-            CC[:, 0, i, j] = cc12[nSamples // 2 :] / norm_overlap
-            if i != j:
-                # cross-correlation is symmetric with C(tau) = C(-tau)^T
-                cc21 = cc12[::-1]
-                CC[:, 0, j, i] = cc21[nSamples // 2 :] / norm_overlap
+        # correlate channel i with all channels j <= i in one go
+        cc12 = irfft(fwd[:, i, None] * rev[:, : i + 1], n=nFFT, axis=0)[start : start + nSamples]
+        CC[:, 0, i, : i + 1] = cc12[nSamples // 2 :] / norm_overlap
+        # cross-correlation is symmetric with C(tau) = C(-tau)^T
+        cc21 = cc12[::-1, :i]
+        CC[:, 0, :i, i] = cc21[nSamples // 2 :] / norm_overlap
 
     # normalize with products of std
     if norm:
@@ -328,7 +328,7 @@ def connectivityanalysis(
         # user picked discrete set of time points
     else:
         sinfo = data.sampleinfo
-    lenTrials = np.diff(sinfo).squeeze()
+    lenTrials = sinfo[:, 1] - sinfo[:, 0]
     nTrials = len(sinfo)
 
     # validate channel combinations parameter
@@ -483,7 +483,7 @@ def connectivityanalysis(
                 # check that for SpectralData input, we have empty time axes
                 # no time-resolved Granger supported atm
                 if isinstance(data, SpectralData):
-                    if data.data.shape[data.dimord.index("time")] != len(data.trials):
+                    if data.data.shape[timeAxis] != len(data.trials):
                         raise NotImplementedError(
                             "Time resolved Granger causality from tf-spectra not available atm"
                         )
@@ -683,8 +683,9 @@ def connectivityanalysis(
         elif channelcmb is not None and method == 'granger':
             senders, receivers = channelcmb
 
-            # create new filename
-            fname = spy.CrossSpectralData().filename
+            # create new filename, the result file is kept open
+            # for all pairs instead of re-opening it for every single write
+            fname = spy.CrossSpectralData._gen_filename()
             with h5py.File(fname, "w") as h5file:
 
                 shape = (1, len(st_out.freq), len(senders), len(receivers))
@@ -692,22 +693,19 @@ def connectivityanalysis(
                                              dtype=np.float32,
                                              shape=shape)
 
-            # compute granger in pairs
-            for idx1, ch1 in enumerate(senders):
-                for idx2, ch2 in enumerate(receivers):
-                    # 2-channel quadratic csd
-                    st_out.selectdata(channel_i=[ch1, ch2], channel_j=[ch1, ch2], inplace=True)
+                # compute granger in pairs
+                for idx1, ch1 in enumerate(senders):
+                    for idx2, ch2 in enumerate(receivers):
+                        # 2-channel quadratic csd
+                        st_out.selectdata(channel_i=[ch1, ch2], channel_j=[ch1, ch2], inplace=True)
 
-                    # single pair result
-                    pair_out = spy.CrossSpectralData(dimord=st_dimord)
-                    av_compRoutine.initialize(st_out, pair_out._stackingDim, chan_per_worker=None)
-                    av_compRoutine.pre_check()  # make sure we got a trial_average
-                    av_compRoutine.compute(st_out, pair_out, parallel=kwargs.get("parallel"), log_dict=log_dict)
-
-                    # write result, idx1/idx2 directly encode positions in result matrix
-                    with h5py.File(fname, "r+") as h5file:
-                        dset = h5file['data']
+                        # single pair result
+                        pair_out = spy.CrossSpectralData(dimord=st_dimord)
+                        av_compRoutine.initialize(st_out, pair_out._stackingDim, chan_per_worker=None)
+                        av_compRoutine.pre_check()  # make sure we got a trial_average
+                        av_compRoutine.compute(st_out, pair_out, parallel=kwargs.get("parallel"), log_dict=log_dict)
 
+                        # write result, idx1/idx2 directly encode positions in result matrix
                         # only direction sender(ch1) -> receiver(ch2)
                         dset[0, :, idx1, idx2] = pair_out.data[0, :, 0, 1]
 
@@ -833,7 +831,7 @@ def cross_spectra(
         sinfo = data.sampleinfo
     else:
         sinfo = data.selection.trialdefinition[:, :2]
-    lenTrials = np.diff(sinfo).squeeze()
+    lenTrials = sinfo[:, 1] - sinfo[:, 0]
 
     taper, taper_opt = process_taper(
         taper,
@@ -128,7 +128,10 @@ class BaseData(ABC):
 
     @property
     def _stackingDim(self):
-        if any(["DiscreteData" in str(base) for base in self.__class__.__mro__]):
+        # (local import: `DiscreteData` depends on this module)
+        from .discrete_data import DiscreteData
+
+        if isinstance(self, DiscreteData):
             return 0
         else:
             if self._stackingDimLabel is not None and self.dimord is not None:
@@ -279,7 +282,9 @@ class BaseData(ABC):
 
         """
         if propertyName == "data":
-            if any(["DiscreteData" in str(base) for base in self.__class__.__mro__]):
+            from .discrete_data import DiscreteData
+
+            if isinstance(self, DiscreteData):
                 ndim = 2
             if ndim is None:
                 ndim = len(self._defaultDimord)
@@ -518,20 +523,23 @@ class BaseData(ABC):
             array_parser(val, varname="data", hasinf=False, dims=ndim)
 
         # Ensure we don't have a mix of real/complex arrays
-        if np.unique([np.iscomplexobj(val) for val in inData]).size > 1:
+        if len({np.iscomplexobj(val) for val in inData}) > 1:
             lgl = "list of numeric NumPy arrays of same numeric type (real/complex)"
             act = "real and complex NumPy arrays"
             raise SPYValueError(legal=lgl, varname="data", actual=act)
 
         # Requirements for input arrays differ wrt data-class (`DiscreteData` always 2D)
-        if any(["ContinuousData" in str(base) for base in self.__class__.__mro__]):
+        from .continuous_data import ContinuousData
+
+        if isinstance(self, ContinuousData):
 
             # Ensure shapes match up
             if any(val.shape != inData[0].shape for val in inData):
                 lgl = "NumPy arrays of identical shape"
                 act = "NumPy arrays with mismatching shapes"
                 raise SPYValueError(legal=lgl, varname="data", actual=act)
-            trialLens = [val.shape[self.dimord.index("time")] for val in inData]
+            timeIdx = self.dimord.index("time")
+            trialLens = [val.shape[timeIdx] for val in inData]
 
         else:
 
@@ -544,7 +552,8 @@ class BaseData(ABC):
                 lgl = "NumPy 2d-arrays with {} columns".format(nCol)
                 act = "NumPy arrays of different shape"
                 raise SPYValueError(legal=lgl, varname="data", actual=act)
-            trialLens = [np.nanmax(val[:, self.dimord.index("sample")]) for val in inData]
+            sidx = self.dimord.index("sample")
+            trialLens = [np.nanmax(val[:, sidx]) for val in inData]
 
         nTrials = len(trialLens)
 
@@ -560,8 +569,12 @@ class BaseData(ABC):
             trialdefinition[:, 2] = 0
 
         # Finally, concatenate provided arrays and let corresponding setting method
-        # perform the actual HDF magic
-        data = np.concatenate(inData, axis=self._stackingDim)
+        # perform the actual HDF magic (a single array is written as is, w/o
+        # an intermediate concatenated copy)
+        if nTrials == 1:
+            data = inData[0]
+        else:
+            data = np.concatenate(inData, axis=self._stackingDim)
         self._set_dataset_property_with_ndarray(data, propertyName, ndim)
         self.trialdefinition = trialdefinition
 
@@ -813,7 +826,9 @@ class BaseData(ABC):
 
         # Special case `DiscreteData`: `dimord` encodes no. of expected cols/rows;
         # ensure this is consistent w/`inData`!
-        if any(["DiscreteData" in str(base) for base in self.__class__.__mro__]):
+        from .discrete_data import DiscreteData
+
+        if isinstance(self, DiscreteData):
             if len(self._defaultDimord) not in inData.shape:
                 lgl = "array with {} columns corresponding to dimord {}"
                 lgl = lgl.format(len(self._defaultDimord), self._defaultDimord)
@@ -1212,20 +1227,22 @@ class BaseData(ABC):
         spy.save(self, filename=filename, container=container, tag=tag, overwrite=overwrite)
 
     # Helper function generating pseudo-random temp file-names
-    def _gen_filename(self):
+    @classmethod
+    def _gen_filename(cls):
 
         fname_hsh = blake2b(digest_size=4, salt=os.urandom(blake2b.SALT_SIZE)).hexdigest()
         fname = os.path.join(
             __storage__,
             "spy_{sess:s}_{hash:s}{ext:s}".format(
-                sess=__sessionid__, hash=fname_hsh, ext=self._classname_to_extension()
+                sess=__sessionid__, hash=fname_hsh, ext=cls._classname_to_extension()
             ),
         )
         return fname
 
     # Helper function converting object class-name to usable file extension
-    def _classname_to_extension(self):
-        return "." + self.__class__.__name__.split("Data")[0].lower()
+    @classmethod
+    def _classname_to_extension(cls):
+        return "." + cls.__name__.split("Data")[0].lower()
 
     # Legacy support
     def __repr__(self):
@@ -1290,7 +1307,7 @@ class BaseData(ABC):
     def __eq__(self, other):
 
         # If other object is not a Syncopy data-class, get out
-        if not "BaseData" in str(other.__class__.__mro__):
+        if not isinstance(other, BaseData):
             SPYInfo("Not a Syncopy object")
             return False
 
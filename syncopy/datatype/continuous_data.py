@@ -21,16 +21,12 @@ from .base_data import BaseData
 from syncopy.shared.parsers import scalar_parser, array_parser
 from syncopy.shared.errors import SPYValueError, SPYError
 from syncopy.shared.tools import best_match
-from syncopy.plotting import sp_plotting, mp_plotting
 from syncopy.io.nwb import _analog_timelocked_to_nwbfile
 from .util import TimeIndexer
 
 
 from syncopy import __pynwb__
 
-if __pynwb__:  # pragma: no cover
-    from pynwb import NWBHDF5IO
-
 
 __all__ = ["AnalogData", "SpectralData", "CrossSpectralData", "TimeLockData"]
 
@@ -79,12 +75,14 @@ class ContinuousData(BaseData, ABC):
     @property
     def is_time_locked(self):
 
-        # check for equal offsets
-        if not np.unique(self.trialdefinition[:, 2]).size == 1:
+        # check for equal offsets (single pass, no sorting as with `np.unique`)
+        offsets = self.trialdefinition[:, 2]
+        if offsets.size == 0 or not np.all(offsets == offsets[0]):
             return False
 
         # check for equal sample sizes of the trials
-        if not np.unique(np.diff(self.sampleinfo, axis=1)).size == 1:
+        lenTrials = self.sampleinfo[:, 1] - self.sampleinfo[:, 0]
+        if not np.all(lenTrials == lenTrials[0]):
             return False
 
         return True
@@ -114,8 +112,8 @@ class ContinuousData(BaseData, ABC):
         for attr in ppattrs:
             value = getattr(self, attr)
             if hasattr(value, "shape") and attr == "data" and self.sampleinfo is not None:
-                tlen = np.unique(np.diff(self.sampleinfo))
-                if tlen.size == 1:
+                tlen = self.sampleinfo[:, 1] - self.sampleinfo[:, 0]
+                if tlen.size > 0 and np.all(tlen == tlen[0]):
                     trlstr = "of length {} ".format(str(tlen[0]))
                 else:
                     trlstr = ""
@@ -164,8 +162,9 @@ class ContinuousData(BaseData, ABC):
     def _shapes(self):
         if self.sampleinfo is not None:
             shp = [list(self.data.shape) for k in range(self.sampleinfo.shape[0])]
+            stackDim = self._stackingDim
             for k, sg in enumerate(self.sampleinfo):
-                shp[k][self._stackingDim] = sg[1] - sg[0]
+                shp[k][stackDim] = sg[1] - sg[0]
             return [tuple(sp) for sp in shp]
 
     @property
@@ -175,7 +174,7 @@ class ContinuousData(BaseData, ABC):
         if self._channel is None and self._data is not None:
             nChannel = self.data.shape[self.dimord.index("channel")]
             # default labels
-            return np.array(["channel" + str(i + 1).zfill(len(str(nChannel))) for i in range(nChannel)])
+            return _default_labels("channel", nChannel)
         return self._channel
 
     @channel.setter
@@ -291,10 +290,11 @@ class ContinuousData(BaseData, ABC):
         """
         shp = list(self.data.shape)
         idx = [slice(None)] * len(self.dimord)
+        stackDim = self._stackingDim
         stop = int(self.sampleinfo[trialno, 1])
         start = int(self.sampleinfo[trialno, 0])
-        shp[self._stackingDim] = stop - start
-        idx[self._stackingDim] = slice(start, stop)
+        shp[stackDim] = stop - start
+        idx[stackDim] = slice(start, stop)
 
         # process existing data selections
         if self.selection is not None:
@@ -314,20 +314,19 @@ class ContinuousData(BaseData, ABC):
                 # account for trial offsets and compute slicing index + shape
                 start = start + tstart
                 stop = start + (tstop - tstart)
-                idx[self._stackingDim] = slice(start, stop)
-                shp[self._stackingDim] = stop - start
+                idx[stackDim] = slice(start, stop)
+                shp[stackDim] = stop - start
 
             else:
-                idx[self._stackingDim] = [tp + start for tp in tsel]
-                shp[self._stackingDim] = len(tsel)
+                idx[stackDim] = [tp + start for tp in tsel]
+                shp[stackDim] = len(tsel)
 
             # process the rest
-            dims = list(self.dimord)
-            dims.pop(self._stackingDim)
-            for dim in dims:
+            for dimIdx, dim in enumerate(self.dimord):
+                if dimIdx == stackDim:
+                    continue
                 sel = getattr(self.selection, dim)
                 if sel is not None:
-                    dimIdx = self.dimord.index(dim)
                     idx[dimIdx] = sel
                     if isinstance(sel, slice):
                         begin, end, delta = sel.start, sel.stop, sel.step
@@ -465,11 +464,15 @@ class AnalogData(ContinuousData):
     # implement plotting
     def singlepanelplot(self, shifted=True, **show_kwargs):
 
+        from syncopy.plotting import sp_plotting
+
         figax = sp_plotting.plot_AnalogData(self, shifted, **show_kwargs)
         return figax
 
     def multipanelplot(self, **show_kwargs):
 
+        from syncopy.plotting import mp_plotting
+
         figax = mp_plotting.plot_AnalogData(self, **show_kwargs)
         return figax
 
@@ -518,6 +521,8 @@ class AnalogData(ContinuousData):
         if not __pynwb__:
             raise SPYError("NWB support is not available. Please install the 'pynwb' package.")
 
+        from pynwb import NWBHDF5IO
+
         nwbfile = _analog_timelocked_to_nwbfile(
             self,
             nwbfile=nwbfile,
@@ -560,7 +565,7 @@ class SpectralData(ContinuousData):
         """:class:`numpy.ndarray` : list of window functions used"""
         if self._taper is None and self._data is not None:
             nTaper = self.data.shape[self.dimord.index("taper")]
-            return np.array(["taper" + str(i + 1).zfill(len(str(nTaper))) for i in range(nTaper)])
+            return _default_labels("taper", nTaper)
         return self._taper
 
     @taper.setter
@@ -688,11 +693,15 @@ class SpectralData(ContinuousData):
     # implement plotting
     def singlepanelplot(self, logscale=True, **show_kwargs):
 
+        from syncopy.plotting import sp_plotting
+
         figax = sp_plotting.plot_SpectralData(self, logscale, **show_kwargs)
         return figax
 
     def multipanelplot(self, **show_kwargs):
 
+        from syncopy.plotting import mp_plotting
+
         figax = mp_plotting.plot_SpectralData(self, **show_kwargs)
         return figax
 
@@ -753,7 +762,7 @@ class CrossSpectralData(ContinuousData):
         # if data exists but no user-defined channel labels, create them on the fly
         if self._channel_i is None and self._data is not None:
             nChannel = self.data.shape[self.dimord.index("channel_i")]
-            return np.array(["channel" + str(i + 1).zfill(len(str(nChannel))) for i in range(nChannel)])
+            return _default_labels("channel", nChannel)
 
         return self._channel_i
 
@@ -787,7 +796,7 @@ class CrossSpectralData(ContinuousData):
         # if data exists but no user-defined channel labels, create them on the fly
         if self._channel_j is None and self._data is not None:
             nChannel = self.data.shape[self.dimord.index("channel_j")]
-            return np.array(["channel" + str(i + 1).zfill(len(str(nChannel))) for i in range(nChannel)])
+            return _default_labels("channel", nChannel)
 
         return self._channel_j
 
@@ -839,6 +848,8 @@ class CrossSpectralData(ContinuousData):
 
     def singlepanelplot(self, **show_kwargs):
 
+        from syncopy.plotting import sp_plotting
+
         return sp_plotting.plot_CrossSpectralData(self, **show_kwargs)
 
 
@@ -954,11 +965,15 @@ class TimeLockData(ContinuousData):
     # implement plotting
     def singlepanelplot(self, shifted=True, **show_kwargs):
 
+        from syncopy.plotting import sp_plotting
+
         figax = sp_plotting.plot_AnalogData(self, shifted, **show_kwargs)
         return figax
 
     def multipanelplot(self, **show_kwargs):
 
+        from syncopy.plotting import mp_plotting
+
         figax = mp_plotting.plot_AnalogData(self, **show_kwargs)
         return figax
 
@@ -995,9 +1010,19 @@ class TimeLockData(ContinuousData):
         if not __pynwb__:
             raise SPYError("NWB support is not available. Please install the 'pynwb' package.")
 
+        from pynwb import NWBHDF5IO
+
         nwbfile = _analog_timelocked_to_nwbfile(
             self, nwbfile=None, with_trialdefinition=with_trialdefinition, is_raw=is_raw
         )
         # Write the file to disk.
         with NWBHDF5IO(outpath, "w") as io:
             io.write(nwbfile)
+
+
+def _default_labels(prefix, num):
+    """
+    Default labels `prefix1`, `prefix2`, ... zero-padded to the width of `num`
+    """
+    width = len(str(num))
+    return np.array([prefix + str(i).zfill(width) for i in range(1, num + 1)])
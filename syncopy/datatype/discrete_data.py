@@ -15,15 +15,11 @@ from .base_data import BaseData, FauxTrial
 from .methods.definetrial import definetrial
 from syncopy.shared.parsers import scalar_parser, array_parser
 from syncopy.shared.errors import SPYValueError, SPYError, SPYTypeError
-from syncopy.plotting import spike_plotting
 
 from syncopy.io.nwb import _spikedata_to_nwbfile
 
 from syncopy import __pynwb__
 
-if __pynwb__:  # pragma: no cover
-    from pynwb import NWBHDF5IO
-
 
 __all__ = ["SpikeData", "EventData"]
 
@@ -189,9 +185,19 @@ class DiscreteData(BaseData, ABC):
             idx = idx.reshape(self.sampleinfo.shape)
 
             self._trialslice = [slice(st, end) for st, end in idx]
-            self.trialid = np.full((samples.shape), -1, dtype=int)
-            for itrl, itrl_slice in enumerate(self._trialslice):
-                self.trialid[itrl_slice] = itrl
+            # For sorted, non-overlapping trials (the common case), mark trial
+            # boundaries and integrate them in one pass instead of assigning
+            # trial-IDs slice by slice
+            if np.all(idx[1:, 0] >= idx[:-1, 1]):
+                marks = np.zeros((samples.size + 1,), dtype=int)
+                trlNo = np.arange(1, idx.shape[0] + 1)
+                np.add.at(marks, idx[:, 0], trlNo)
+                np.add.at(marks, idx[:, 1], -trlNo)
+                self.trialid = np.cumsum(marks[:-1]) - 1
+            else:
+                self.trialid = np.full((samples.shape), -1, dtype=int)
+                for itrl, itrl_slice in enumerate(self._trialslice):
+                    self.trialid[itrl_slice] = itrl
 
             self._trial_ids = np.arange(self.sampleinfo.shape[0])
 
@@ -199,11 +205,9 @@ class DiscreteData(BaseData, ABC):
     def time(self):
         """list(float): trigger-relative time of each event"""
         if self.samplerate is not None and self.sampleinfo is not None:
-            return [
-                (trl[:, self.dimord.index("sample")] - self.sampleinfo[tk, 0] + self.trialdefinition[tk, 2])
-                / self.samplerate
-                for tk, trl in enumerate(self.trials)
-            ]
+            sidx = self.dimord.index("sample")
+            sample0 = self.sampleinfo[:, 0] - self.trialdefinition[:, 2]
+            return [(trl[:, sidx] - sample0[tk]) / self.samplerate for tk, trl in enumerate(self.trials)]
 
     @property
     def trialid(self):
@@ -373,7 +377,7 @@ class SpikeData(DiscreteData):
 
     def _compute_unique_idx(self):
         """
-        Use `np.unique` on whole(!) dataset to compute globally
+        Use `np.unique` on whole(!) dataset (block-wise) to compute globally
         available channel and unit indices only once
 
         This function gets triggered by the constructor
@@ -386,9 +390,21 @@ class SpikeData(DiscreteData):
         if self.data is None:
             return
 
-        # this is costly and loads the entire hdf5 dataset into memory!
-        self.channel_idx = np.unique(self.data[:, self.dimord.index("channel")])
-        self.unit_idx = np.unique(self.data[:, self.dimord.index("unit")])
+        # this is costly and scans the entire hdf5 dataset: go through it in
+        # blocks of rows (fetching both columns with a single read per block)
+        # to keep the memory footprint bounded
+        chanIdx = self.dimord.index("channel")
+        unitIdx = self.dimord.index("unit")
+        lo, hi = min(chanIdx, unitIdx), max(chanIdx, unitIdx)
+        blockSize = 1 << 20
+        chanBlocks, unitBlocks = [], []
+        # (empty datasets still yield one (empty) block of the right dtype)
+        for start in range(0, max(self.data.shape[0], 1), blockSize):
+            ids = self.data[start : start + blockSize, lo : hi + 1]
+            chanBlocks.append(np.unique(ids[:, chanIdx - lo]))
+            unitBlocks.append(np.unique(ids[:, unitIdx - lo]))
+        self.channel_idx = np.unique(np.concatenate(chanBlocks))
+        self.unit_idx = np.unique(np.concatenate(unitBlocks))
 
     @property
     def channel(self):
@@ -435,10 +451,9 @@ class SpikeData(DiscreteData):
         """
 
         # channel entries in self.data are 0-based
-        chan_max = self.channel_idx.max()
-        channel_labels = np.array(
-            ["channel" + str(int(i + 1)).zfill(len(str(chan_max))) for i in self.channel_idx]
-        )
+        width = len(str(self.channel_idx.max()))
+        channel_nums = (self.channel_idx + 1).astype(int).tolist()
+        channel_labels = np.array(["channel" + str(i).zfill(width) for i in channel_nums])
         return channel_labels
 
     @property
@@ -492,8 +507,9 @@ class SpikeData(DiscreteData):
         Creates the default unit labels
         """
 
-        unit_max = self.unit_idx.max()
-        return np.array(["unit" + str(int(i + 1)).zfill(len(str(unit_max))) for i in self.unit_idx])
+        width = len(str(self.unit_idx.max()))
+        unit_nums = (self.unit_idx + 1).astype(int).tolist()
+        return np.array(["unit" + str(i).zfill(width) for i in unit_nums])
 
     # Helper function that extracts by-trial unit-indices
     def _get_unit(self, trials, units=None):
@@ -528,8 +544,9 @@ class SpikeData(DiscreteData):
         """
         if units is not None:
             indices = []
+            unitIdx = self.dimord.index("unit")
             for trlno in trials:
-                thisTrial = self.data[self._trialslice[trlno], self.dimord.index("unit")]
+                thisTrial = self.data[self._trialslice[trlno], unitIdx]
                 trialUnits = []
                 for unit in units:
                     trialUnits += list(np.where(thisTrial == unit)[0])
@@ -697,6 +714,8 @@ class SpikeData(DiscreteData):
         if not __pynwb__:
             raise SPYError("NWB support is not available. Please install the 'pynwb' package.")
 
+        from pynwb import NWBHDF5IO
+
         nwbfile = _spikedata_to_nwbfile(self, nwbfile=None, with_trialdefinition=with_trialdefinition)
         # Write the file to disk.
         with NWBHDF5IO(outpath, "w") as io:
@@ -705,12 +724,16 @@ class SpikeData(DiscreteData):
     # implement plotting
     def singlepanelplot(self, **show_kwargs):
 
+        from syncopy.plotting import spike_plotting
+
         figax = spike_plotting.plot_single_figure_SpikeData(self, **show_kwargs)
         return figax
 
     # implement plotting
     def multipanelplot(self, **show_kwargs):
 
+        from syncopy.plotting import spike_plotting
+
         figax = spike_plotting.plot_multi_figure_SpikeData(self, **show_kwargs)
         return figax
 
@@ -769,8 +792,9 @@ class EventData(DiscreteData):
         """
         if eventids is not None:
             indices = []
+            evtIdx = self.dimord.index("eventid")
             for trlno in trials:
-                thisTrial = self.data[self._trialslice[trlno], self.dimord.index("eventid")]
+                thisTrial = self.data[self._trialslice[trlno], evtIdx]
                 trialEvents = []
                 for event in eventids:
                     trialEvents += list(np.where(thisTrial == event)[0])
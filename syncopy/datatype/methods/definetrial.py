@@ -4,7 +4,6 @@
 #
 
 # Builtin/3rd party package imports
-import sys
 import numpy as np
 
 # Local imports
@@ -82,6 +81,9 @@ def definetrial(
 
     """
 
+    # local import: the data classes themselves depend on this module
+    from syncopy.datatype.continuous_data import ContinuousData
+
     # Start by vetting input object
     data_parser(obj, varname="obj")
     if obj.data is None:
@@ -97,7 +99,7 @@ def definetrial(
         else:
             array_parser(trialdefinition, varname="trialdefinition", dims=2)
 
-            if any(["ContinuousData" in str(base) for base in obj.__class__.__mro__]):
+            if isinstance(obj, ContinuousData):
                 scount = obj.data.shape[obj.dimord.index("time")]
             else:
                 scount = np.inf
@@ -117,7 +119,7 @@ def definetrial(
             evt = False
     else:
         # Construct object-class-specific `trl` arrays treating data-set as single trial
-        if any(["ContinuousData" in str(base) for base in obj.__class__.__mro__]):
+        if isinstance(obj, ContinuousData):
             trl = np.array([[0, obj.data.shape[obj.dimord.index("time")], 0]])
         else:
             sidx = obj.dimord.index("sample")
@@ -356,22 +358,9 @@ def definetrial(
         )
 
     # Finally: assign `sampleinfo`, `t0` and `trialinfo` (and potentially `trialid`)
-    # use target class setter
+    # use target class setter (`DiscreteData` also computes `trialid` there)
     tgt.trialdefinition = trl
 
-    # In the discrete case, we have some additinal work to do
-    if any(["DiscreteData" in str(base) for base in tgt.__class__.__mro__]):
-
-        # Compute trial-IDs by matching data samples with provided trial-bounds
-        samples = tgt.data[:, tgt.dimord.index("sample")]
-        idx = np.searchsorted(samples, tgt.sampleinfo.ravel())
-        idx = idx.reshape(tgt.sampleinfo.shape)
-
-        tgt._trialslice = [slice(st, end) for st, end in idx]
-        tgt.trialid = np.full((samples.shape), -1, dtype=int)
-        for itrl, itrl_slice in enumerate(tgt._trialslice):
-            tgt.trialid[itrl_slice] = itrl
-
     # Write log entry
     if ref == tgt:
         ref.log = (
@@ -384,7 +373,7 @@ def definetrial(
         tgt.log = "trial-definition extracted from EventData object: "
         tgt._log += ref_log
         tgt.cfg = {
-            "method": sys._getframe().f_code.co_name,
+            "method": "definetrial",
             "EventData object": ref.cfg,
         }
         ref.log = "updated trial-defnition of {} object".format(tgt.__class__.__name__)
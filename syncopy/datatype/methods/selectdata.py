@@ -427,6 +427,18 @@ def _get_selection_size(data):
     """
     Local helper routine for computing the on-disk size of an active data-selection
     """
+    sel = data.selection
+
+    # For continuous data all trials share the selected non-time dimensions, so
+    # one `FauxTrial` and the sample counts of the (already computed)
+    # trialdefinition of the selection suffice
+    if sel._dataClass not in ["SpikeData", "EventData"] and len(sel.trial_ids) > 0:
+        fauxTrl = data._preview_trial(sel.trial_ids[0])
+        shp = list(fauxTrl.shape)
+        shp[data._stackingDim] = 1
+        nSamples = (sel.trialdefinition[:, 1] - sel.trialdefinition[:, 0]).sum()
+        return nSamples * np.prod(shp) * fauxTrl.dtype.itemsize / 1024**2
+
     fauxTrials = [data._preview_trial(trlno) for trlno in data.selection.trial_ids]
     fauxSizes = [np.prod(ftrl.shape) * ftrl.dtype.itemsize for ftrl in fauxTrials]
     return sum(fauxSizes) / 1024**2
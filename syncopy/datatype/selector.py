@@ -396,7 +396,10 @@ class Selector:
                         raise SPYValueError(legal=lgl, varname=vname, actual=act)
 
             # Assign timing selection and copy over samplerate from source object
-            if any(["DiscreteData" in str(base) for base in data.__class__.__mro__]):
+            # (local import: `DiscreteData` depends on this module)
+            from .discrete_data import DiscreteData
+
+            if isinstance(data, DiscreteData):
                 # special case DiscreteData: here we need an assignable property
                 # for `_make_consistent` so we unpack the Indexer right away
                 self._time = list(
@@ -427,30 +430,36 @@ class Selector:
         if self._dataClass in ["SpikeData", "EventData"]:
             trlDef = trl[self.trial_ids, :]
         else:
-            trlDef = np.zeros((len(self.trial_ids), trl.shape[1]))
-            counter = 0
+            # gather slice bounds (or list lengths) of all trials in flat vectors
+            # and compute sample counts and offsets in one go
+            nTrials = len(self.trial_ids)
+            trlIdx = np.array(self.trial_ids, dtype=np.intp)
+            offsets = data._trialdefinition[trlIdx, 2]
+            starts = np.zeros(nTrials)
+            stops = trl[trlIdx, 1] - trl[trlIdx, 0]
+            steps = np.ones(nTrials)
+            isList = np.zeros(nTrials, dtype=bool)
             for tk, trlno in enumerate(self.trial_ids):
                 tsel = self.time[trlno]
                 if isinstance(tsel, slice):
-                    start, stop, step = tsel.start, tsel.stop, tsel.step
-                    if start is None:
-                        start = 0
-                    if stop is None:
-                        stop = trl[trlno, 1] - trl[trlno, 0]
-                    if step is None:
-                        step = 1
-                    nSamples = (stop - start) / step
-                    endSample = stop + data._trialdefinition[trlno, 2]
-                    t0 = int(endSample - nSamples)
+                    if tsel.start is not None:
+                        starts[tk] = tsel.start
+                    if tsel.stop is not None:
+                        stops[tk] = tsel.stop
+                    if tsel.step is not None:
+                        steps[tk] = tsel.step
                 else:
-                    nSamples = len(tsel)
-                    if nSamples == 0:
-                        t0 = 0
-                    else:
-                        t0 = data._trialdefinition[trlno, 2]
-                trlDef[tk, :3] = [counter, counter + nSamples, t0]
-                trlDef[tk, 3:] = trl[trlno, 3:]
-                counter += nSamples
+                    isList[tk] = True
+                    stops[tk] = len(tsel)
+            nSamples = (stops - starts) / steps
+            t0 = np.trunc(stops + offsets - nSamples)
+            t0[isList] = np.where(nSamples[isList] == 0, 0, offsets[isList])
+            trlDef = np.empty((nTrials, trl.shape[1]))
+            trlDef[:, 1] = np.cumsum(nSamples)
+            trlDef[:1, 0] = 0
+            trlDef[1:, 0] = trlDef[:-1, 1]
+            trlDef[:, 2] = t0
+            trlDef[:, 3:] = trl[self.trial_ids, 3:]
         self._trialdefinition = trlDef
 
     @property
@@ -713,14 +722,19 @@ class Selector:
                     targetArr = target
                 else:
                     targetArr = np.arange(target.size)
-                if not set(selection).issubset(targetArr):
-                    lgl = "list/array of {} existing names or indices".format(selectkey)
-                    raise SPYValueError(legal=lgl, varname=vname)
+
+                # Map names/indices to their position(s) in `targetArr` once, so
+                # that every selector is a single dict lookup instead of a full scan
+                refIndex = {}
+                for idx, val in enumerate(targetArr.tolist()):
+                    refIndex.setdefault(val, []).append(idx)
 
                 # Preserve order and duplicates of selection - don't use `np.isin` here!
-                idxList = []
-                for sel in selection:
-                    idxList += list(np.where(targetArr == sel)[0])
+                try:
+                    idxList = [idx for sel in selection.tolist() for idx in refIndex[sel]]
+                except KeyError:
+                    lgl = "list/array of {} existing names or indices".format(selectkey)
+                    raise SPYValueError(legal=lgl, varname=vname)
 
                 if selectkey in ["unit", "eventid"]:
                     setattr(
@@ -948,7 +962,10 @@ class SelectionTimeIndexer:
         self.idx_set = set(idx_list)
         self._len = len(idx_list)
 
-        if any(["DiscreteData" in str(base) for base in self.__class__.__mro__]):
+        # (local import: `DiscreteData` depends on this module)
+        from .discrete_data import DiscreteData
+
+        if isinstance(data_object, DiscreteData):
             self.is_discrete = True
             self.trialtime = data_object.trialtime
         else:
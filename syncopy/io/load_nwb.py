@@ -27,10 +27,6 @@ from syncopy import __pynwb__
 __all__ = ["load_nwb"]
 
 
-if __pynwb__:
-    import pynwb
-
-
 def _is_valid_nwb_file(filename):
     try:
         this_python = os.path.join(os.path.dirname(sys.executable), "python")
@@ -91,6 +87,8 @@ def load_nwb(
             raise SPYError(err)
 
     # Load NWB meta data from disk
+    import pynwb
+
     nwbio = pynwb.NWBHDF5IO(nwbFullName, "r", load_namespaces=True)
     nwbfile = nwbio.read()
 
@@ -282,12 +280,18 @@ def load_nwb(
             ts_resolution = ttlChans[0].resolution
         else:
             ts_resolution = ttlChans[0].timestamps__resolution
+        # NWB uses -1 for "unknown" resolution, which can't be turned into a samplerate
+        if not ts_resolution > 0:
+            lgl = "TTL time stamps with known (positive) resolution"
+            raise SPYValueError(lgl, varname="resolution", actual=str(ts_resolution))
 
         evtDset[:, 0] = ((ttlChans[0].timestamps[()] - tStarts[0]) / ts_resolution).astype(np.intp)
         evtDset[:, 1] = ttlVals[0].data[()].astype(int)
         evtDset[:, 2] = ttlChans[0].data[()].astype(int)
         evtData.data = evtDset
-        evtData.samplerate = float(1 / ts_resolution)
+        # the reciprocal of the (binary) float resolution carries round-off noise,
+        # e.g., 24999.999999999996 for 25 kHz clocks: drop precision beyond 1e-9 Hz
+        evtData.samplerate = round(1 / float(ts_resolution), 9)
         if hasTrials:
             evtData.trialdefinition = trl
         else:
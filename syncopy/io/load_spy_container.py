@@ -7,7 +7,6 @@
 import os
 import json
 import h5py
-import sys
 import numpy as np
 from glob import glob
 
@@ -334,7 +333,7 @@ def _load(filename, checksum, mode, out):
     ]:
         setattr(out, key, jsonDict[key])
 
-    thisMethod = sys._getframe().f_code.co_name.replace("_", "")
+    thisMethod = "load"
 
     # Write log-entry
     msg = "Read files v. {ver:s} ".format(ver=jsonDict["_version"])
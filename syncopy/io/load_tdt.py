@@ -5,6 +5,8 @@
 # load_tdt.py Merge separate TDT SEV files into one HDF5 file
 
 import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import re
 import numpy as np
@@ -13,10 +15,13 @@ import h5py
 
 # Local imports
 from syncopy.shared.parsers import io_parser, scalar_parser
-from syncopy.shared.errors import SPYWarning, SPYValueError
+from syncopy.shared.errors import SPYWarning, SPYValueError, SPYInfo
 from syncopy.shared.tools import StructDict
 import syncopy as spy
 
+# TSQ block start/stop marker: event code, 4 padding bytes and time stamp
+_TSQ_MARKER = struct.Struct("<i4xd")
+
 
 # --- The user exposed function ---
 
@@ -222,35 +227,37 @@ class ESI_TDTinfo:
         tsq_list = _get_source_paths(self.block_path, ".tsq")
         if len(tsq_list) > 1:
             raise Exception("multiple TSQ files found\n{0}".format(", ".join(tsq_list)))
+        # keep the (default) buffered reader: unlike raw `FileIO`, its `read(n)`
+        # loops until `n` bytes (or EOF) are in, which the marker unpacking and
+        # the EOF test of the header loop below rely on
         tsq = open(tsq_list[0], "rb")
-        tsq.seek(0, os.SEEK_SET)
+        _advise_sequential(tsq)
+        # block start/stop markers are each followed by a time stamp:
+        # read both fields (plus 4 padding bytes) in one go
         tsq.seek(48, os.SEEK_SET)
-        code1 = np.fromfile(tsq, dtype=np.int32, count=1)
+        code1, header.start_time = _TSQ_MARKER.unpack(tsq.read(_TSQ_MARKER.size))
         assert code1 == self.STARTBLOCK, "Block start marker not found"
-        tsq.seek(56, os.SEEK_SET)
-        header.start_time = np.fromfile(tsq, dtype=np.float64, count=1)
 
         # read stop time
         tsq.seek(-32, os.SEEK_END)
-        code2 = np.fromfile(tsq, dtype=np.int32, count=1)
+        code2, stop_time = _TSQ_MARKER.unpack(tsq.read(_TSQ_MARKER.size))
         if code2 != self.STOPBLOCK:
             SPYWarning(
                 "Block end marker not found, block did not end cleanly. Try setting T2 smaller if errors occur"
             )
             header.stop_time = np.nan
         else:
-            tsq.seek(-24, os.SEEK_END)
-            header.stop_time = np.fromfile(tsq, dtype=np.float64, count=1)
+            header.stop_time = stop_time
 
         [data.info.tankpath, data.info.blockname] = os.path.split(os.path.normpath(self.block_path))
-        data.info.start_date = datetime.fromtimestamp(header.start_time[0])
+        data.info.start_date = datetime.fromtimestamp(header.start_time)
         if not np.isnan(header.start_time):
             data.info.utc_start_time = data.info.start_date.strftime("%H:%M:%S")
         else:
             data.info.utc_start_time = np.nan
 
         if not np.isnan(header.stop_time):
-            data.info.stop_date = datetime.fromtimestamp(header.stop_time[0])
+            data.info.stop_date = datetime.fromtimestamp(header.stop_time)
             data.info.utc_stop_time = data.info.stop_date.strftime("%H:%M:%S")
         else:
             data.info.stop_date = np.nan
@@ -404,7 +411,7 @@ class ESI_TDTinfo:
             # eof reached
             if heads.size < read_size:
                 break
-        print(
+        SPYInfo(
             "Reading data from t = {0}s to t = {1}s".format(
                 np.round(self.t1, 2), np.round(np.maximum(last_ts, self.t2), 2)
             )
@@ -719,13 +726,39 @@ class ESI_TDTdata:
         header["total_num_channel"] = len(Files)
         return header
 
-    def read_data(self, filename):
-        HEADERSIZE = 40
-        """Read data from a TDT SEV file created by the RS4 streamer"""
-        with open(filename, "rb") as f:
-            f.seek(HEADERSIZE)
-            data = np.fromfile(f, dtype="single")
-        return data
+    # size of the SEV file header in bytes
+    HEADERSIZE = 40
+
+    def read_data(self, filename, count=-1):
+        """Read (the first `count` samples of) a TDT SEV file created by the RS4 streamer"""
+        with open(filename, "rb", buffering=0) as f:
+            _advise_sequential(f)
+            return np.fromfile(f, dtype="single", count=count, offset=self.HEADERSIZE)
+
+    def read_into(self, out, filename):
+        """
+        Fill the contiguous 1d-array (view) `out` in place with the first
+        samples of a TDT SEV file (no temporary array gets allocated)
+        """
+        buf = memoryview(out).cast("B")
+        nRead = 0
+        with open(filename, "rb", buffering=0) as f:
+            _advise_sequential(f)
+            f.seek(self.HEADERSIZE)
+            # raw reads may return less than requested, keep going until EOF
+            while nRead < buf.nbytes:
+                n = f.readinto(buf[nRead:])
+                if not n:
+                    break
+                nRead += n
+        if nRead < buf.nbytes:
+            lgl = "SEV file with at least {} samples".format(out.size)
+            act = "file with {} samples".format(nRead // out.itemsize)
+            raise SPYValueError(legal=lgl, varname=filename, actual=act)
+
+    def num_samples(self, filename):
+        """Number of samples in a TDT SEV file (inferred from its size, w/o reading it)"""
+        return (os.path.getsize(filename) - self.HEADERSIZE) // np.dtype("single").itemsize
 
     def md5sum(self, filename):
         from hashlib import md5
@@ -739,9 +772,8 @@ class ESI_TDTdata:
     def data_aranging(self, Files, DataInfo_loaded):
         AData = spy.AnalogData(dimord=["time", "channel"])
         hdf_out_path = AData.filename
-        LenOfData = self.read_data(Files[0]).shape[
-            0
-        ]  # Lenght of the data is always set to the length of the first channel
+        # Length of the data is always set to the length of the first channel
+        LenOfData = self.num_samples(Files[0])
         with h5py.File(hdf_out_path, "w") as combined_data_file:
             idxStartStop = [
                 np.clip(
@@ -751,22 +783,35 @@ class ESI_TDTdata:
                 )
                 for jj in range(0, len(Files), self.chan_in_chunks)
             ]
-            print(
+            SPYInfo(
                 "Merging {0} files in {1} chunks each with {2} channels into \n   {3}".format(
                     len(Files), len(idxStartStop), self.chan_in_chunks, hdf_out_path
                 )
             )
-            for (start, stop) in tqdm(iterable=idxStartStop, desc="chunk", unit="chunk", disable=None):
-                data = [self.read_data(Files[jj])[:LenOfData] for jj in range(start, stop)]
-                data = np.vstack(data).T
-                if start == 0:
-                    # this is the actual dataset for the AnalogData
-                    target = combined_data_file.create_dataset(
-                        "data", shape=(data.shape[0], len(Files)), dtype="single"
-                    )
-                if self.subtract_median:
-                    data -= np.median(data, keepdims=True).astype(data.dtype)
-                target[:, start:stop] = data
+            # this is the actual dataset for the AnalogData
+            target = combined_data_file.create_dataset("data", shape=(LenOfData, len(Files)), dtype="single")
+            # channels of a chunk are read directly into the columns of a single
+            # (re-used) block; the block is column-major, s.t. every channel lands
+            # in contiguous memory and the interleaving into the (row-major) dataset
+            # happens in one go upon writing
+            chunk_buffer = np.empty((LenOfData, self.chan_in_chunks), dtype="single", order="F")
+            # the files of a chunk are read concurrently (file I/O releases the GIL),
+            # each thread filling its own column of the block
+            nThreads = min(self.chan_in_chunks, os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=nThreads) as pool:
+                for k, (start, stop) in enumerate(
+                    tqdm(iterable=idxStartStop, desc="chunk", unit="chunk", disable=None)
+                ):
+                    data = chunk_buffer[:, : stop - start]
+                    columns = [data[:, col] for col in range(stop - start)]
+                    # consume the iterator to propagate read errors
+                    list(pool.map(self.read_into, columns, Files[start:stop]))
+                    # let the OS fetch the next chunk while this one gets written
+                    if k + 1 < len(idxStartStop):
+                        _prefetch(Files[slice(*idxStartStop[k + 1])])
+                    if self.subtract_median:
+                        data -= np.median(data, keepdims=True).astype(data.dtype)
+                    target[:, start:stop] = data
 
             # link dataset to AnalogData instance
             AData.data = target
@@ -878,3 +923,29 @@ def _natural_sort(file_names):
         return [convert(c) for c in re.split("([0-9]+)", key)]
 
     return sorted(file_names, key=alphanum_key)
+
+
+def _advise_sequential(fobj):
+    """
+    Tell the OS that `fobj` is going to be read front to back
+    (enlarged read-ahead). No-op on platforms w/o `posix_fadvise`
+    """
+
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(fobj.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+def _prefetch(file_names):
+    """
+    Ask the OS to asynchronously load the files in `file_names` into
+    the page cache. No-op on platforms w/o `posix_fadvise`
+    """
+
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for fname in file_names:
+        fd = os.open(fname, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
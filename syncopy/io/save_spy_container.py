@@ -182,17 +182,18 @@ def save(out, container=None, tag=None, filename=None, overwrite=False):
             if os.path.exists(dataFile):
                 if not os.path.isfile(dataFile):
                     raise SPYIOError(dataFile)
-                if overwrite:
-                    try:
-                        h5f = h5py.File(dataFile, mode="w")
-                        h5f.close()
-                    except Exception as exc:
-                        msg = "Cannot overwrite {} - file may still be open. "
-                        msg += "Original error message below\n{}"
-                        raise SPYError(msg.format(dataFile, str(exc)))
-                else:
+                if not overwrite:
                     raise SPYIOError(dataFile, exists=True)
-        h5f = h5py.File(dataFile, mode="w")
+
+        # Mode "w" truncates an existing file, no need for a separate probing open
+        try:
+            h5f = h5py.File(dataFile, mode="w")
+        except Exception as exc:
+            if not (overwrite and os.path.isfile(dataFile)):
+                raise exc
+            msg = "Cannot overwrite {} - file may still be open. "
+            msg += "Original error message below\n{}"
+            raise SPYError(msg.format(dataFile, str(exc)))
 
         # Save each member of `_hdfFileDatasetProperties` in target HDF file
         for datasetName in out._hdfFileDatasetProperties:
@@ -7,7 +7,7 @@
 import os
 import sys
 import shutil
-import inspect
+import hashlib
 import numpy as np
 from datetime import datetime
 from glob import glob
@@ -53,10 +53,18 @@ def hash_file(fname, bsize=65536):
     Internal helper routine, do not parse inputs
     """
 
-    hash = __checksum_algorithm__()
     with open(fname, "rb") as f:
-        for block in iter(lambda: f.read(bsize), b""):
-            hash.update(block)
+        # Python 3.11+: let `hashlib` stream the file through a reused buffer
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, __checksum_algorithm__).hexdigest()
+        hash = __checksum_algorithm__()
+        buf = bytearray(bsize)
+        view = memoryview(buf)
+        while True:
+            nbytes = f.readinto(buf)
+            if not nbytes:
+                break
+            hash.update(view[:nbytes])
     return hash.hexdigest()
 
 
@@ -87,7 +95,7 @@ def cleanup(older_than=24, interactive=True, only_current_session=False):
     older_than = int(older_than)
 
     # For clarification: show location of storage folder that is scanned here
-    funcName = "Syncopy <{}>".format(inspect.currentframe().f_code.co_name)
+    funcName = "Syncopy <cleanup>"
     storage_size_gb, storage_num_files = get_dir_size(__storage__, out="GB")
     dirInfo = "\n{name:s} Analyzing temporary storage folder '{dir:s}' containing {numf:d} files with total size {sizegb:.2f} GB...\n"
     log(
@@ -228,11 +236,10 @@ def clear():
     >>> spy.clear()
     """
 
-    # Get current frame
-    thisFrame = sys._getframe()
+    funcName = "Syncopy <clear>"
 
-    # For later reference: dynamically fetch name of current function
-    funcName = "Syncopy <{}>".format(thisFrame.f_code.co_name)
+    # Get current frame (to access the caller's namespace)
+    thisFrame = sys._getframe()
 
     # Go through caller's namespace and execute `clear` of `BaseData` children
     counter = 0
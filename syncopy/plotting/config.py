@@ -15,6 +15,7 @@ background = "#fcfcfc"  # hint of gray
 
 if __plt__:
     import matplotlib as mpl
+    import matplotlib.style
 
     # to allow both older and newer matplotlib versions
     if parse(mpl.__version__) < parse("3.6"):
@@ -21,16 +21,28 @@ spectralDTypes = {
     "complex": np.complex64,
 }
 
+
+def _abs2(x):
+    """
+    Squared magnitude of (complex) `x`, computed on its real and imaginary
+    parts to not materialize the complex product `x * conj(x)`
+    """
+    re, im = x.real, x.imag
+    abs2 = re * re
+    abs2 += im * im
+    return abs2.astype(spectralDTypes["pow"], copy=False)
+
+
 #: output conversion of complex fourier coefficients
 spectralConversions = {
-    "pow": lambda x: (x * np.conj(x)).real.astype(spectralDTypes["pow"]),
-    "abs": lambda x: (np.absolute(x)).real.astype(spectralDTypes["abs"]),
-    "fourier": lambda x: x.astype(spectralDTypes["fourier"]),
+    "pow": _abs2,
+    "abs": lambda x: np.absolute(x).astype(spectralDTypes["abs"], copy=False),
+    "fourier": lambda x: x.astype(spectralDTypes["fourier"], copy=False),
     "real": lambda x: np.real(x).astype(spectralDTypes["real"]),
     "imag": lambda x: np.imag(x).astype(spectralDTypes["imag"]),
-    "angle": lambda x: np.angle(x).astype(spectralDTypes["angle"]),
-    "absreal": lambda x: np.abs(np.real(x)).astype(spectralDTypes["absreal"]),
-    "absimag": lambda x: np.abs(np.imag(x)).astype(spectralDTypes["absimag"]),
+    "angle": lambda x: np.angle(x).astype(spectralDTypes["angle"], copy=False),
+    "absreal": lambda x: np.abs(np.real(x)).astype(spectralDTypes["absreal"], copy=False),
+    "absimag": lambda x: np.abs(np.imag(x)).astype(spectralDTypes["absimag"], copy=False),
 }
 
 # FT compat
@@ -38,12 +50,13 @@ spectralConversions["complex"] = spectralConversions["fourier"]
 
 
 #: available tapers of :func:`~syncopy.freqanalysis` and  :func:`~syncopy.connectivity`
-all_windows = windows.__all__
+all_windows = list(windows.__all__)  # copy, don't alter SciPy's module attribute
 all_windows.remove("get_window")  # aux. function
 all_windows.remove("exponential")  # not symmetric
 all_windows.remove("dpss")  # activated via `tapsmofrq`
 
 availableTapers = all_windows
+availableTapersSet = frozenset(availableTapers)  # for membership tests
 availablePaddingOpt = ["maxperlen", "nextpow2"]
 
 #: general, method agnostic, parameters for our CRs
@@ -9,15 +9,17 @@
 
 # Builtin/3rd party package imports
 import numpy as np
+import math
 import numbers
+import functools
 from inspect import signature
 from scipy.signal import windows
 
-from syncopy.specest.mtmfft import _get_dpss_pars
 from syncopy.shared.errors import SPYValueError, SPYWarning, SPYInfo
 from syncopy.shared.parsers import scalar_parser, array_parser
 from syncopy.shared.const_def import (
     availableTapers,
+    availableTapersSet,
     generalParameters,
     availablePaddingOpt,
 )
@@ -68,20 +70,23 @@ def process_padding(pad, lenTrials, samplerate):
         actual = f"{pad}"
         raise SPYValueError(legal=lgl, varname="pad", actual=actual)
 
+    # longest trial determines the minimal padding length
+    maxLen = lenTrials.max()
+
     # zero padding of ALL trials the same way
     if isinstance(pad, numbers.Number):
 
-        scalar_parser(pad, varname="pad", lims=[lenTrials.max() / samplerate, np.inf])
+        scalar_parser(pad, varname="pad", lims=[maxLen / samplerate, np.inf])
         abs_pad = int(pad * samplerate)
 
     # or pad to optimal FFT lengths
     elif pad == "nextpow2":
-        abs_pad = _nextpow2(int(lenTrials.max()))
+        abs_pad = _nextpow2(int(maxLen))
 
     # no padding in case of equal length trials
     elif pad == "maxperlen":
-        abs_pad = int(lenTrials.max())
-        if lenTrials.min() != lenTrials.max():
+        abs_pad = int(maxLen)
+        if lenTrials.min() != maxLen:
             msg = f"Unequal trial lengths present, padding all trials to {abs_pad} samples"
             SPYInfo(msg)
 
@@ -241,7 +246,7 @@ def process_taper(
         return None, {}
 
     # See if taper choice is supported
-    if taper not in availableTapers:
+    if not isinstance(taper, str) or taper not in availableTapersSet:
         lgl = "'" + "or '".join(opt + "' " for opt in availableTapers)
         raise SPYValueError(legal=lgl, varname="taper", actual=taper)
 
@@ -343,6 +348,9 @@ def process_taper(
 
         # --------------------------------------------------------------
         # set parameters for scipy.signal.windows.dpss
+        # local import to avoid circular dependency with the specest package
+        from syncopy.specest.mtmfft import _get_dpss_pars
+
         NW, Kmax = _get_dpss_pars(tapsmofrq, nSamples, samplerate)
         # --------------------------------------------------------------
 
@@ -428,9 +436,9 @@ def check_passed_kwargs(lcls, defaults, frontend_name):
             SPYWarning(msg, caller=__name__.split(".")[-1])
 
 
+@functools.lru_cache(maxsize=128)
 def _nextpow2(number):
     """Find integer power of 2 greater than or equal to number."""
-    n = 1
-    while n < number:
-        n *= 2
-    return n
+    if number <= 1:
+        return 1
+    return 1 << (math.ceil(number) - 1).bit_length()
@@ -357,11 +357,15 @@ def array_parser(
     # "Exotic" arrays (str et al.) must contain only elements of the same type
     # (however, don't be too stingy with numeric arrays - `[2, 2.0, 3]`` is okay)
     if ntype not in [None, "numeric", "int_like"]:
-        if np.unique([str(type(a)) for a in var]).size > 1:
+        if len({type(a) for a in var}) > 1:
             raise SPYTypeError(var, varname=varname, expected="array elements of identical type")
 
-    # Convert input to ndarray to simplify parsing
-    arr = np.array(var)
+    # Convert input to ndarray to simplify parsing (w/o copying existing arrays)
+    arr = np.asarray(var)
+
+    # Integer arrays cannot hold `NaN`/`inf` and are trivially int-like: don't
+    # scan potentially large arrays (e.g., spike samples) only to confirm this
+    isint = np.issubdtype(arr.dtype, np.integer)
 
     # If bounds-checking is requested but `ntype` is not set, use the
     # generic "numeric" option to ensure array is actually numeric
@@ -386,7 +390,7 @@ def array_parser(
                     varname=varname,
                     actual=msg.format(dt=str(arr.dtype)),
                 )
-            if ntype == "int_like":
+            if ntype == "int_like" and not isint:
                 if not np.array_equal(arr, np.round(arr)):
                     raise SPYValueError(msg.format(dt=ntype), varname=varname)
         else:
@@ -399,29 +403,31 @@ def array_parser(
 
     # If required, parse finiteness of array-elements
     if hasinf is not None:
-        if not hasinf and np.isinf(arr).any():
+        anyinf = not isint and np.isinf(arr).any()
+        if not hasinf and anyinf:
             lgl = "finite numerical array"
             act = "array with {} `inf` entries".format(str(np.isinf(arr).sum()))
             raise SPYValueError(legal=lgl, varname=varname, actual=act)
-        if hasinf and not np.isinf(arr).any():
+        if hasinf and not anyinf:
             lgl = "numerical array with infinite (`np.inf`) entries"
             act = "finite numerical array"
             raise SPYValueError(legal=lgl, varname=varname, actual=act)
 
     # If required, parse well-posedness of array-elements
     if hasnan is not None:
-        if not hasnan and np.isnan(arr).any():
+        anynan = not isint and np.isnan(arr).any()
+        if not hasnan and anynan:
             lgl = "well-defined numerical array"
             act = "array with {} `NaN` entries".format(str(np.isnan(arr).sum()))
             raise SPYValueError(legal=lgl, varname=varname, actual=act)
-        if hasnan and not np.isnan(arr).any():
+        if hasnan and not anynan:
             lgl = "numerical array with undefined (`np.nan`) entries"
             act = "well-defined numerical array"
             raise SPYValueError(legal=lgl, varname=varname, actual=act)
 
     # If required perform component-wise bounds-check (remove NaN's and Inf's first)
     if lims is not None:
-        fi_arr = arr[np.isfinite(arr)]
+        fi_arr = arr if isint else arr[np.isfinite(arr)]
         if np.issubdtype(fi_arr.dtype, np.dtype("complex").type):
             amin = min(fi_arr.real.min(), fi_arr.imag.min())
             amax = max(fi_arr.real.max(), fi_arr.imag.max())
@@ -538,8 +544,11 @@ def data_parser(data, varname="", dataclass=None, writable=None, empty=None, dim
     array_parser : similar functionality for parsing array-like objects
     """
 
+    # local import: the data classes themselves depend on this module
+    from syncopy.datatype.base_data import BaseData
+
     # Make sure `data` is (derived from) `BaseData`
-    if not any(["BaseData" in str(base) for base in data.__class__.__mro__]):
+    if not isinstance(data, BaseData):
         raise SPYTypeError(data, varname=varname, expected="Syncopy data object")
 
     # If requested, check specific data-class of object
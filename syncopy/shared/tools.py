@@ -9,6 +9,7 @@ from numbers import Number
 from copy import deepcopy
 import inspect
 import json
+from functools import lru_cache
 
 # Local imports
 from syncopy.shared.errors import SPYValueError, SPYWarning, SPYTypeError, SPYError
@@ -312,9 +313,15 @@ def best_match(source, selection, span=False, tol=None, squash_duplicates=False)
     # Do not perform O(n) potentially unnecessary sort operations...
     issorted = True
 
-    # Interval-selections are a lot easier than discrete time-points...
+    # Interval-selections are a lot easier than discrete time-points: for
+    # (the typical case of) monotonic time/freq axes, bisect the interval bounds
     if span:
-        idx = np.intersect1d(np.where(source >= selection[0])[0], np.where(source <= selection[1])[0])
+        if source.size > 1 and np.diff(source).min() < 0:
+            idx = np.flatnonzero((source >= selection[0]) & (source <= selection[1]))
+        else:
+            lo = np.searchsorted(source, selection[0], side="left")
+            hi = np.searchsorted(source, selection[1], side="right")
+            idx = np.arange(lo, max(lo, hi), dtype=np.intp)
     else:
         issorted = True
         if source.size > 1 and np.diff(source).min() < 0:
@@ -368,9 +375,23 @@ def get_defaults(obj):
 
     if not callable(obj):
         raise SPYTypeError(obj, varname="obj", expected="SyNCoPy function or class")
-    dct = {
-        k: v.default
+    try:
+        defaults = _signature_defaults(obj)
+    except TypeError:
+        # unhashable callables can't be cached
+        defaults = _signature_defaults.__wrapped__(obj)
+    # hand out a fresh (mutable) dict, the cached pairs stay untouched
+    return StructDict(defaults)
+
+
+@lru_cache(maxsize=None)
+def _signature_defaults(obj):
+    """
+    Cached `argument : default value` pairs of `obj`'s call-signature,
+    frontends query their own defaults on every invocation
+    """
+    return tuple(
+        (k, v.default)
         for k, v in inspect.signature(obj).parameters.items()
         if v.default != v.empty and v.name != "cfg"
-    }
-    return StructDict(dct)
+    )
@@ -3,7 +3,7 @@
 # Helper routines to normalize Fourier spectra
 #
 
-import numpy as np
+import math
 
 
 def _norm_spec(ftr, nSamples, fs, mode="bins"):
@@ -11,6 +11,22 @@ def _norm_spec(ftr, nSamples, fs, mode="bins"):
     """
     Normalizes the complex Fourier transform to
     power spectral density or 1Hz-bin units.
+    The normalization is done in-place, `ftr` is
+    returned for convenience.
+    """
+
+    # single (Python) scalar: keeps the dtype of `ftr` and walks it only once
+    ftr *= _spec_scale(nSamples, fs, mode)
+
+    return ftr
+
+
+def _spec_scale(nSamples, fs, mode="bins"):
+
+    """
+    The factor :func:`_norm_spec` scales the Fourier
+    transform with, allows to normalize while writing
+    the transform to its destination
     """
 
     # frequency bins
@@ -19,9 +35,7 @@ def _norm_spec(ftr, nSamples, fs, mode="bins"):
     elif mode == "bins":
         delta_f = 1
 
-    ftr *= np.sqrt(2) / (nSamples * np.sqrt(delta_f))
-
-    return ftr
+    return math.sqrt(2 / delta_f) / nSamples
 
 
 def _norm_taper(taper, windows, nSamples):
@@ -34,13 +48,15 @@ def _norm_taper(taper, windows, nSamples):
     distributed over the spectral window response.
     """
 
+    # NOTE: keep `windows.sum()` a NumPy scalar, degenerate (all-zero)
+    # windows then yield inf/nan like before instead of raising
     if taper == "dpss":
-        windows *= np.sqrt(nSamples)
+        windows *= math.sqrt(nSamples)
     elif taper == "boxcar":
-        windows *= np.sqrt(nSamples / windows.sum())
+        windows *= math.sqrt(nSamples / windows.sum())
     # weird 3 point normalization,
     # checks out exactly for 'hann' though
     else:
-        windows *= np.sqrt(4 / 3) * np.sqrt(nSamples / windows.sum())
+        windows *= math.sqrt(4 / 3 * nSamples / windows.sum())
 
     return windows
@@ -165,12 +165,21 @@ def mtmfft_cF(
     if noCompute:
         return outShape, spectralDTypes[output]
 
+    # real valued outputs are stored in single precision, so there is
+    # nothing to gain from double precision tapering and FFTs
+    dtype = np.float32 if output in ["pow", "abs"] else None
+
     # detrend, does not work with 'FauxTrial' data..
     if polyremoval == 0:
-        dat = signal.detrend(dat, type="constant", axis=0, overwrite_data=True)
+        # de-mean and (down-)cast the result in a single pass over the data
+        out = None if dtype is None else np.empty(dat.shape, dtype=dtype)
+        dat = np.subtract(dat, dat.mean(axis=0), out=out, casting="same_kind")
     elif polyremoval == 1:
         dat = signal.detrend(dat, type="linear", axis=0, overwrite_data=True)
 
+    if dtype is not None:
+        dat = dat.astype(dtype, copy=False)
+
     # call actual specest method
     res, freqs = mtmfft(dat, **method_kwargs)
 
@@ -398,14 +407,26 @@ def mtmconvol_cF(
         # In case tapers aren't preserved allocate `spec` "too big"
         # and average afterwards
         spec = np.full((nTime, nTaper, nFreq, nChannels), np.nan, dtype=spectralDTypes[output])
+        convert = spectralConversions[output]
 
-        ftr, freqs = mtmfft(dat[soi[0], :], samplerate, taper=taper, taper_opt=taper_opt)
+        # windows get clipped at the trial borders, the frequency
+        # selection follows the first one
+        segLengths = np.array([len(range(*sl.indices(dat.shape[0]))) for sl in soi])
+        freqs = np.fft.rfftfreq(segLengths[0], 1 / samplerate)
         _, fIdx = best_match(freqs, foi, squash_duplicates=True)
-        spec[0, ...] = spectralConversions[output](ftr[:, fIdx, :])
-        # loop over remaining soi to center windows on
-        for tk in range(1, len(soi)):
-            ftr, freqs = mtmfft(dat[soi[tk], :], samplerate, taper=taper, taper_opt=taper_opt)
-            spec[tk, ...] = spectralConversions[output](ftr[:, fIdx, :])
+
+        # windows of equal length are stacked along the channel axis and
+        # transformed by a single `mtmfft` call (in blocks to bound memory)
+        for segLen in np.unique(segLengths):
+            segIdx = np.flatnonzero(segLengths == segLen)
+            blockSize = max(1, 2**22 // (segLen * nChannels))
+            for k0 in range(0, segIdx.size, blockSize):
+                block = segIdx[k0 : k0 + blockSize]
+                segs = np.concatenate([dat[soi[tk], :] for tk in block], axis=1)
+                ftr, _ = mtmfft(segs, samplerate, taper=taper, taper_opt=taper_opt)
+                # (taper x freq x soi * channel) -> (soi x taper x freq x channel)
+                ftr = ftr[:, fIdx, :].reshape(ftr.shape[0], fIdx.size, block.size, nChannels)
+                spec[block] = convert(ftr.transpose(2, 0, 1, 3))
 
     # Average across tapers if wanted
     # only valid if output='pow' !
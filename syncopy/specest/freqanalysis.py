@@ -433,14 +433,11 @@ def freqanalysis(
             lgl = "no `toi` specification due to active in-place time-selection in input dataset"
             raise SPYValueError(legal=lgl, varname="toi", actual=toi)
         sinfo = data.selection.trialdefinition[:, :2]
-        trialList = data.selection.trial_ids
     else:
-        trialList = list(range(len(data.trials)))
         sinfo = data.sampleinfo
-    lenTrials = np.diff(sinfo).squeeze()
-    if not lenTrials.shape:
-        lenTrials = lenTrials[None]
-    numTrials = len(trialList)
+    # one entry per (selected) trial
+    lenTrials = sinfo[:, 1] - sinfo[:, 0]
+    numTrials = lenTrials.size
 
     # check polyremoval
     if polyremoval is not None:
@@ -603,7 +600,17 @@ def freqanalysis(
         # actually attainable freqs
         # these are the frequencies attached to the SpectralData by the CR!
         if foi is not None:
-            foi, _ = best_match(freqs, foi, squash_duplicates=True)
+            # `freqs` is a uniform grid starting at 0 Hz: locate the bin below
+            # each `foi` arithmetically, then pick the closer of it and its upper
+            # neighbour by their float distances (ties go up, exactly as in `best_match`)
+            if freqs.size > 1:
+                lo = np.clip(np.floor(foi / freqs[1]).astype(np.intp), 0, freqs.size - 2)
+                foi_idx = lo + (np.abs(foi - freqs[lo]) >= np.abs(foi - freqs[lo + 1]))
+            else:
+                foi_idx = np.zeros(np.shape(foi), dtype=np.intp)
+            # remove duplicate matches but keep the order of `foi`
+            _, first = np.unique(foi_idx, return_index=True)
+            foi = freqs[foi_idx[np.sort(first)]]
         elif foilim is not None:
             foi, _ = best_match(freqs, foilim, span=True, squash_duplicates=True)
         else:
@@ -643,6 +650,9 @@ def freqanalysis(
     # Now, prepare explicit compute-classes for chosen method
     # -------------------------------------------------------
 
+    # resolved by `detect_parallel_client`: `True` iff a dask client runs the computation
+    parallel = kwargs["parallel"]
+
     if method == "mtmfft":
 
         check_effective_parameters(MultiTaperFFT, defaults, lcls)
@@ -655,6 +665,8 @@ def freqanalysis(
             "nSamples": minSampleNum,
             "demean_taper": demean_taper,
             "ft_compat": ft_compat,
+            # multi-threaded FFTs only if `compute` runs sequentially (no dask workers)
+            "fft_workers": None if parallel else -1,
         }
 
         # Set up compute-class
@@ -730,7 +742,7 @@ def freqanalysis(
         # If `toi` was 'all' or a percentage, use entire time interval of (selected)
         # trials and check if those trials have *approximately* equal length
         if toi is None:
-            if not np.allclose(lenTrials, [minSampleNum] * lenTrials.size):
+            if not np.allclose(lenTrials, minSampleNum):
                 msg = (
                     "processing trials of different lengths (min = {}; max = {} samples)"
                     + " with `toi = 'all'`"
@@ -988,7 +1000,7 @@ def freqanalysis(
         chan_per_worker=kwargs.get("chan_per_worker"),
         keeptrials=keeptrials,
     )
-    specestMethod.compute(data, out, parallel=kwargs.get("parallel"), log_dict=log_dct)
+    specestMethod.compute(data, out, parallel=parallel, log_dict=log_dct)
 
     # FOOOF is a post-processing method of MTMFFT output, so we handle it here, once
     # the MTMFFT has finished.
@@ -1047,7 +1059,7 @@ def freqanalysis(
             chan_per_worker=kwargs.get("chan_per_worker"),
             keeptrials=keeptrials,
         )
-        fooofMethod.compute(fooof_data, fooof_out, parallel=kwargs.get("parallel"), log_dict=log_dct)
+        fooofMethod.compute(fooof_data, fooof_out, parallel=parallel, log_dict=log_dct)
         out = fooof_out
 
     # Perform mtmconvolv post-processing for `method='welch'`.
@@ -7,11 +7,10 @@
 import numpy as np
 import logging
 import platform
-from scipy import signal
 
 # local imports
 from .stft import stft
-from ._norm_spec import _norm_taper
+from .mtmfft import _get_windows
 
 
 def mtmconvol(
@@ -98,8 +97,6 @@ def mtmconvol(
     if taper is None:
         taper = "boxcar"
 
-    taper_func = getattr(signal.windows, taper)
-
     if taper_opt is None:
         taper_opt = {}
 
@@ -110,11 +107,9 @@ def mtmconvol(
     if taper == "dpss":
         taper_opt["sym"] = False
 
-    # only truly 2d for multi-taper "dpss"
-    windows = np.atleast_2d(taper_func(nperseg, **taper_opt))
-
-    # normalize window(s)
-    windows = _norm_taper(taper, windows, nperseg)
+    # normalized window(s), only truly 2d for multi-taper "dpss";
+    # cached, so trials of equal length don't re-compute them
+    windows = _get_windows(taper, nperseg, nperseg, taper_opt)
 
     # number of time points in the output
     if boundary is None:
@@ -5,12 +5,13 @@
 
 # Builtin/3rd party package imports
 import numpy as np
-from scipy import signal
+from scipy import signal, fft
+from functools import lru_cache
 import logging
 import platform
 
 # local imports
-from ._norm_spec import _norm_spec, _norm_taper
+from ._norm_spec import _spec_scale, _norm_taper
 
 
 def mtmfft(
@@ -21,6 +22,7 @@ def mtmfft(
     taper_opt=None,
     demean_taper=False,
     ft_compat=False,
+    fft_workers=None,
 ):
     """
     (Multi-)tapered fast Fourier transform. Returns
@@ -51,6 +53,10 @@ def mtmfft(
     ft_compat : bool
         Set to `True` to use Field Trip's normalization,
         which is NOT independent of the padding size
+    fft_workers : int or None
+        Number of threads used by :func:`scipy.fft.rfft`,
+        `-1` means all available cores. Keep at `None`
+        (single thread) when running on parallel workers.
 
     Returns
     -------
@@ -93,38 +99,52 @@ def mtmfft(
     if taper_opt is None:
         taper_opt = {}
 
-    taper_func = getattr(signal.windows, taper)
     # only really 2d if taper='dpss' with Kmax > 1
-    # here we take the actual signal lengths!
-    windows = np.atleast_2d(taper_func(signal_length, **taper_opt))
-    # normalize window with total (after padding) length
-    windows = _norm_taper(taper, windows, nSamples)
+    windows = _get_windows(taper, signal_length, nSamples, taper_opt)
+    # taper single precision data in single precision: the spectra are
+    # stored as complex64 anyway, float64 tapering only doubles the memory traffic
+    if data_arr.dtype == np.float32:
+        windows = windows.astype(np.float32)
 
     # Fourier transforms (nTapers x nFreq x nChannels)
-    ftr = np.zeros((windows.shape[0], nFreq, nChannels), dtype="complex64")
+    ftr = np.empty((windows.shape[0], nFreq, nChannels), dtype="complex64")
 
     logger = logging.getLogger("syncopy_" + platform.node())
     logger.debug(
         f"Running mtmfft on {len(windows)} windows, data chunk has {nSamples} samples and {nChannels} channels."
     )
 
-    for taperIdx, win in enumerate(windows):
-        win = np.tile(win, (nChannels, 1)).T
-        win *= data_arr
+    # FT uses potentially padded length `nSamples`, which dilutes the power
+    if ft_compat:
+        scale = _spec_scale(nSamples, samplerate)
+    # here the normalization adapts such that padding is NOT changing power
+    else:
+        scale = _spec_scale(signal_length * np.sqrt(nSamples / signal_length), samplerate)
+
+    # taper and transform blocks of tapers at once (batched FFTs), the block
+    # size bounds the memory needed for the tapered copies of the data
+    taperBlock = min(8, windows.shape[0])
+    # when padding, taper into a zero padded workspace re-used for all blocks:
+    # only the leading `signal_length` samples get (over-)written and the
+    # FFT does not need to build a padded copy of every block
+    padded = nSamples > signal_length
+    if padded:
+        work = np.zeros((taperBlock, nChannels, nSamples), dtype=np.result_type(windows, data_arr))
+    for k0 in range(0, windows.shape[0], taperBlock):
+        tapers = windows[k0 : k0 + taperBlock, np.newaxis, :]
+        # nBlock x nChannels x nSamples
+        if padded:
+            fft_in = work[: tapers.shape[0]]
+            win = fft_in[..., :signal_length]
+            np.multiply(tapers, data_arr.T, out=win)
+        else:
+            fft_in = win = tapers * data_arr.T
         # de-mean again after tapering - needed for Granger!
         if demean_taper:
-            win -= win.mean(axis=0)
-        ftr[taperIdx] = np.fft.rfft(win, n=nSamples, axis=0)
-        # FT uses potentially padded length `nSamples`, which dilutes the power
-        if ft_compat:
-            ftr[taperIdx] = _norm_spec(ftr[taperIdx], nSamples, samplerate)
-        # here the normalization adapts such that padding is NOT changing power
-        else:
-            ftr[taperIdx] = _norm_spec(
-                ftr[taperIdx],
-                signal_length * np.sqrt(nSamples / signal_length),
-                samplerate,
-            )
+            win -= win.mean(axis=-1, keepdims=True)
+        # normalize while casting the transforms into `ftr` (single pass)
+        ftr_block = fft.rfft(fft_in, n=nSamples, axis=-1, workers=fft_workers)
+        np.multiply(ftr_block.transpose(0, 2, 1), scale, out=ftr[k0 : k0 + taperBlock], casting="same_kind")
 
     return ftr, freqs
 
@@ -145,3 +165,52 @@ def _get_dpss_pars(tapsmofrq, nSamples, samplerate):
     Kmax = Kmax if Kmax > 1 else 1
 
     return NW, Kmax
+
+
+# upper bound for the size of a single cached window matrix: the cache lives
+# as long as the (worker) process, so at most 4 x 32MB stay pinned in memory
+_MAX_CACHED_WINDOWS_BYTES = 32 * 1024**2
+
+
+def _get_windows(taper, signal_length, nSamples, taper_opt):
+
+    """
+    Helper function to get the normalized (multi-)taper windows,
+    results are cached: trials (or channel chunks) of equal length
+    re-use the windows instead of re-computing them (e.g. solving
+    the dpss eigenproblem) over and over again. Window matrices
+    larger than `_MAX_CACHED_WINDOWS_BYTES` are computed afresh
+    """
+
+    opt_items = tuple(sorted(taper_opt.items()))
+    nWindows = taper_opt.get("Kmax", 1) if taper == "dpss" else 1
+    if nWindows * signal_length * np.dtype(np.float64).itemsize > _MAX_CACHED_WINDOWS_BYTES:
+        return _make_windows(taper, signal_length, nSamples, opt_items)
+    try:
+        hash(opt_items)
+    except TypeError:
+        # sequence-valued options (e.g. for 'general_cosine') can't be cached
+        return _make_windows(taper, signal_length, nSamples, opt_items)
+    return _cached_windows(taper, signal_length, nSamples, opt_items)
+
+
+def _make_windows(taper, signal_length, nSamples, opt_items):
+
+    """Computes the normalized windows for :func:`_get_windows`"""
+
+    taper_func = getattr(signal.windows, taper)
+    # here we take the actual signal lengths!
+    windows = np.atleast_2d(taper_func(signal_length, **dict(opt_items)))
+    # normalize window with total (after padding) length
+    return _norm_taper(taper, windows, nSamples)
+
+
+@lru_cache(maxsize=4)
+def _cached_windows(taper, signal_length, nSamples, opt_items):
+
+    """Cached version of :func:`_make_windows`"""
+
+    windows = _make_windows(taper, signal_length, nSamples, opt_items)
+    # shared across calls
+    windows.setflags(write=False)
+    return windows
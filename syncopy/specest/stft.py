@@ -96,25 +96,30 @@ def stft(
         if axis != -1:
             dat = np.moveaxis(dat, axis, -1)
 
-    # extend along time axis to fit in
-    # sliding windows at the edges
-    if boundary is not None:
-        zeros_shape = list(dat.shape)
-        zeros_shape[-1] = nperseg // 2
-        zeros = np.zeros(zeros_shape, dtype=dat.dtype)
-        dat = np.concatenate((zeros, dat, zeros), axis=-1)
-
     # defaults to half window overlap
     if noverlap is None:
         noverlap = nperseg // 2
     nstep = nperseg - noverlap
 
+    # extend along time axis to fit in
+    # sliding windows at the edges
+    nEdge = nperseg // 2 if boundary is not None else 0
+    nPadded = dat.shape[-1] + 2 * nEdge
+
     if padded:
         # Pad to integer number of windowed segments
         # I.e make x.shape[-1] = nperseg + (nseg-1)*nstep, with integer nseg
-        nadd = (-(dat.shape[-1] - nperseg) % nstep) % nperseg
-        zeros_shape = list(dat.shape[:-1]) + [nadd]
-        dat = np.concatenate((dat, np.zeros(zeros_shape)), axis=-1)
+        nPadded += (-(nPadded - nperseg) % nstep) % nperseg
+        # the segments get processed in double precision
+        dtype = np.result_type(dat.dtype, np.float64)
+    else:
+        dtype = dat.dtype
+
+    # compute the final length first, s.t. the padded signal gets allocated only once
+    if boundary is not None or padded:
+        padded_dat = np.zeros(dat.shape[:-1] + (nPadded,), dtype=dtype)
+        padded_dat[..., nEdge : nEdge + dat.shape[-1]] = dat
+        dat = padded_dat
 
     # Create strided array of data segments
     if nperseg == 1 and noverlap == 0:
@@ -1,7 +1,10 @@
 from __future__ import division
 
+from functools import lru_cache
+
 import numpy as np
 import scipy
+import scipy.fft
 import scipy.signal
 import scipy.optimize
 import scipy.special
@@ -89,11 +92,68 @@ def cwt_time(data, wavelet, widths, dt, axis):
     # wavelets can be complex so output is complex
     output = np.zeros((len(widths),) + data.shape, dtype=np.complex64)
 
-    # compute in time
+    # the sampled wavelets (and spectra) only depend on the transform
+    # parameters and the signal length, so trials of equal length re-use them
+    N = data.shape[axis]
+    kernels, bank, offsets = _get_wavelet_bank(wavelet, widths, dt, N)
+    if bank.size:
+        fft_data = scipy.fft.fft(data, n=bank.shape[1], axis=axis)
+
     slices = [None for _ in data.shape]
     slices[axis] = slice(None)
     slices = tuple(slices)
-    for ind, width in enumerate(widths):
+    row = 0
+    for ind, (kernel, offset) in enumerate(zip(kernels, offsets)):
+        # short kernels: overlap-add is cheaper than a full length transform
+        if kernel is not None:
+            output[ind, :] = scipy.signal.oaconvolve(data, kernel[slices], mode="same", axes=axis)
+            continue
+        # long kernels: compute in frequency, one (inverse) fft per width
+        conv = scipy.fft.ifft(fft_data * bank[row][slices], axis=axis)
+        row += 1
+        # same as fftconvolve(..., mode="same"): centred w.r.t. the full convolution
+        same = [slice(None) for _ in data.shape]
+        same[axis] = slice(offset, offset + N)
+        output[ind, :] = conv[tuple(same)]
+    return output
+
+
+# upper bound for the size of a single cached wavelet bank: the cache lives
+# as long as the (worker) process, so at most 4 x 32MB stay pinned in memory
+_MAX_CACHED_BANK_BYTES = 32 * 1024**2
+
+
+def _get_wavelet_bank(wavelet, widths, dt, N):
+    """
+    Cached sampled wavelets and their spectra, see :func:`_make_wavelet_bank`.
+    Banks (potentially) larger than `_MAX_CACHED_BANK_BYTES` are built afresh
+    """
+
+    # the spectral bank holds at most one complex128 row of length ~2N per width
+    bank_bytes = len(widths) * scipy.fft.next_fast_len(2 * N - 1) * np.dtype(np.complex128).itemsize
+    key = (type(wavelet), tuple(sorted(vars(wavelet).items())))
+    try:
+        hash(key)
+    except TypeError:
+        # wavelets w/unhashable attributes can't be cached
+        key = None
+    if key is None or bank_bytes > _MAX_CACHED_BANK_BYTES:
+        return _make_wavelet_bank(wavelet, tuple(widths), dt, N)
+    return _cached_wavelet_bank(key, tuple(widths), dt, N)
+
+
+def _make_wavelet_bank(wavelet, widths, dt, N):
+    """
+    Sample the wavelet for each width. Kernels shorter than `N / 8` get
+    returned as is (`None` otherwise), the zero-padded spectra of the
+    longer ones are stacked into `bank`. `offsets` locate the 'same'-mode
+    output within the full linear convolution.
+    """
+
+    kernels = []
+    long_kernels = []
+    offsets = []
+    for width in widths:
         # number of points needed to capture wavelet
         M = 10 * width / dt
         # times to use, centred at zero
@@ -102,10 +162,37 @@ def cwt_time(data, wavelet, widths, dt, axis):
         norm = dt**0.5 / (width * 8 * np.pi)
         wavelet_data = norm * wavelet(t, width)
 
-        # support might be longer than data, but fftconvolve
-        # returns result of 1st input argument lengths!
-        output[ind, :] = scipy.signal.fftconvolve(data, wavelet_data[slices], mode="same")
-    return output
+        # support might be longer than data, but a 'same'-mode
+        # output of length N only sees 2N - 1 samples around the centre
+        centre = (wavelet_data.size - 1) // 2
+        lo = max(0, centre - N + 1)
+        offsets.append(centre - lo)
+        if wavelet_data.size < N / 8:
+            kernels.append(wavelet_data)
+        else:
+            kernels.append(None)
+            long_kernels.append(wavelet_data[lo : centre + N])
+
+    nfft = scipy.fft.next_fast_len(N + max((kernel.size for kernel in long_kernels), default=1) - 1)
+    bank = np.empty((len(long_kernels), nfft), dtype=np.complex128)
+    for row, kernel in enumerate(long_kernels):
+        bank[row] = scipy.fft.fft(kernel, n=nfft)
+    return tuple(kernels), bank, tuple(offsets)
+
+
+@lru_cache(maxsize=4)
+def _cached_wavelet_bank(key, widths, dt, N):
+    """Cached version of :func:`_make_wavelet_bank`, `key` holds the class and attributes of the wavelet"""
+
+    wavelet_class, attrs = key
+    wavelet = wavelet_class()
+    vars(wavelet).update(attrs)
+    kernels, bank, offsets = _make_wavelet_bank(wavelet, widths, dt, N)
+    for kernel in kernels:
+        if kernel is not None:
+            kernel.flags.writeable = False
+    bank.flags.writeable = False
+    return kernels, bank, offsets
 
 
 def cwt_freq(data, wavelet, widths, dt, axis):
@@ -2,10 +2,12 @@
 #
 # syncopy.connectivity backend method tests
 #
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import matplotlib.pyplot as ppl
 
 from syncopy import synthdata
+from syncopy.tests import helpers
 from syncopy.connectivity import csd
 from syncopy.connectivity import ST_compRoutines as stCR
 from syncopy.connectivity.wilson_sf import wilson_sf, regularize_csd, max_rel_err
@@ -27,24 +29,28 @@ def test_coherence():
     phase_shifts = np.array([0, np.pi / 2, np.pi])
 
     nTrials = 100
+    rng = np.random.default_rng(helpers.test_seed)
 
     # shape is (1, nFreq, nChannel, nChannel)
     nFreq = nSamples // 2 + 1
     nChannel = len(phase_shifts)
     avCSD = np.zeros((nFreq, nChannel, nChannel), dtype=np.complex64)
 
-    for i in range(nTrials):
+    # 1 phase phase shifted harmonics, identical for all trials
+    harmonics = np.cos(harm_freq * 2 * np.pi * tvec[:, None] + phase_shifts)
 
-        # 1 phase phase shifted harmonics + white noise + constant, SNR = 1
-        trl_dat = [np.cos(harm_freq * 2 * np.pi * tvec + ps) for ps in phase_shifts]
-        trl_dat = np.array(trl_dat).T
-        trl_dat = np.array(trl_dat) + np.random.randn(nSamples, len(phase_shifts))
+    # + white noise, SNR = 1; drawn upfront to keep the seeded stream in order
+    noise = rng.standard_normal((nTrials, nSamples, nChannel))
 
+    def trial_csd(trl_noise):
         # process every trial individually
-        CSD, freqs = csd.csd(trl_dat, fs, taper="hann", norm=False)  # this is important!
+        return csd.csd(harmonics + trl_noise, fs, taper="hann", norm=False)  # this is important!
 
-        assert avCSD.shape == CSD.shape
-        avCSD += CSD
+    # the FFTs release the GIL, so threads suffice to process trials concurrently
+    with ThreadPoolExecutor() as pool:
+        for CSD, freqs in pool.map(trial_csd, noise):
+            assert avCSD.shape == CSD.shape
+            avCSD += CSD
 
     # this is the trial average
     avCSD /= nTrials
@@ -98,10 +104,12 @@ def test_csd():
     harm_freq = 40
     phase_shifts = np.array([0, np.pi / 2, np.pi])
 
+    rng = np.random.default_rng(helpers.test_seed)
+
     # 1 phase phase shifted harmonics + white noise, SNR = 1
     data = [np.cos(harm_freq * 2 * np.pi * tvec + ps) for ps in phase_shifts]
     data = np.array(data).T
-    data = np.array(data) + np.random.randn(nSamples, len(phase_shifts))
+    data = np.array(data) + rng.standard_normal((nSamples, len(phase_shifts)))
 
     bw = 8  # Hz
     NW = nSamples * bw / (2 * fs)
@@ -168,7 +176,8 @@ def test_wilson():
 
     # -- test error testing routine
 
-    A = np.random.randn(10, 10) + 1j * np.random.randn(10, 10)
+    rng = np.random.default_rng(helpers.test_seed)
+    A = rng.standard_normal((10, 10)) + 1j * rng.standard_normal((10, 10))
 
     assert max_rel_err(A, A + A * 1e-16) < 1e-15
 
@@ -223,9 +232,10 @@ def test_regularization():
     """
     nChannels = 20
     nTrials = 10
+    rng = np.random.default_rng(helpers.test_seed)
     CSD = np.zeros((nChannels, nChannels))
     for _ in range(nTrials):
-        A = np.random.randn(nChannels)
+        A = rng.standard_normal(nChannels)
         CSD += np.outer(A, A)
 
     # --- regularize CSD ---
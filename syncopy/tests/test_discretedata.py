@@ -6,7 +6,6 @@
 # Builtin/3rd party package imports
 import os
 import tempfile
-import time
 import h5py
 import pytest
 import numpy as np
@@ -15,41 +14,85 @@ import numpy as np
 # Local imports
 import syncopy as spy
 from syncopy.datatype import AnalogData, SpikeData, EventData
-from syncopy.io import save, load
+from syncopy.io import load
 from syncopy.shared.errors import SPYValueError, SPYTypeError
-from syncopy.tests.misc import construct_spy_filename
 from syncopy.tests.test_selectdata import getSpikeData
 
 
+def _trial_refs(data, col, ns, width=5):
+    """
+    Reference rows of `data` for each of the consecutive trials
+    ``[start, start + width)`` covering ``ns`` samples, `col` holds the samples
+    """
+    order = np.argsort(data[:, col], kind="stable")
+    bounds = np.searchsorted(data[order, col], np.arange(0, ns + width, width))
+    return [data[np.sort(order[lo:hi]), ...] for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+
+@pytest.fixture(scope="module")
+def tdir(tmp_path_factory):
+    """Scratch directory shared by the save/load tests of this module"""
+    return tmp_path_factory.mktemp("discretedata")
+
+
+# `load` re-applies the trial definition via `definetrial`, which stores it as float
+_FLOAT_ON_LOAD = ("sampleinfo", "_t0", "trialinfo")
+
+
+def _assert_roundtrip(dummy, container, checkAttr, overwrite=False):
+    """
+    Save `dummy` to `container`, load it back and compare values, shapes and
+    dtypes of all `checkAttr` attributes, returns the loaded object
+    """
+    dummy.save(container, overwrite=overwrite)
+    loaded = load(container)
+    for attr in checkAttr:
+        ref = getattr(dummy, attr)
+        if attr in _FLOAT_ON_LOAD:
+            ref = np.asarray(ref, dtype=float)
+        np.testing.assert_array_equal(getattr(loaded, attr), ref, err_msg=attr, strict=True)
+    return loaded
+
+
+def _dup_cols(data):
+    """Side-by-side copy ``[data, data]`` of a 2D array in a single allocation"""
+    ncol = data.shape[1]
+    out = np.empty((data.shape[0], 2 * ncol), dtype=data.dtype)
+    out[:, :ncol] = data
+    out[:, ncol:] = data
+    return out
+
+
 class TestSpikeData:
 
     # Allocate test-dataset
     nc = 10
     ns = 30
     nd = 50
-    seed = np.random.RandomState(13)
-    data = np.vstack(
-        [
-            seed.choice(ns, size=nd),
-            seed.choice(nc, size=nd),
-            seed.choice(int(nc / 2), size=nd),
-        ]
-    ).T
-    data = data[data[:, 0].argsort()]
+    rng = np.random.default_rng(13)
+    data = np.empty((nd, 3), dtype=int)
+    data[:, 0] = rng.integers(ns, size=nd)
+    data[:, 1] = rng.integers(nc, size=nd)
+    data[:, 2] = rng.integers(int(nc / 2), size=nd)
+    data = data[data[:, 0].argsort(kind="stable")]
     data2 = data.copy()
     data2[:, -1] = data[:, 0]
     data2[:, 0] = data[:, -1]
-    trl = np.vstack(
-        [
-            np.arange(0, ns, 5),
-            np.arange(5, ns + 5, 5),
-            np.ones((int(ns / 5),)),
-            np.ones((int(ns / 5),)) * np.pi,
-        ]
-    ).T
-    num_smp = np.unique(data[:, 0]).size
-    num_chn = data[:, 1].max() + 1
-    num_unt = data[:, 2].max() + 1
+    trl = np.empty((int(ns / 5), 4))
+    trl[:, 0] = np.arange(0, ns, 5)
+    trl[:, 1] = np.arange(5, ns + 5, 5)
+    trl[:, 2] = 1
+    trl[:, 3] = np.pi
+    # non-negative integer columns: count occupied bins instead of sorting
+    num_smp = int(np.count_nonzero(np.bincount(data[:, 0])))
+    num_chn = int(data[:, 1].max()) + 1
+    num_unt = int(data[:, 2].max()) + 1
+
+    # trial-defined objects are only read by the tests, so build them once
+    @pytest.fixture(scope="class")
+    @classmethod
+    def trl_dummy(cls):
+        return SpikeData(cls.data, trialdefinition=cls.trl)
 
     def test_init(self):
 
@@ -129,88 +172,100 @@ class TestSpikeData:
         with pytest.raises(SPYValueError):
             SpikeData(np.ones((3,)))
 
-    def test_trialretrieval(self):
+    @pytest.fixture(scope="class", params=["regular", "swapped"])
+    @classmethod
+    def trl_case(cls, request, trl_dummy):
         # test ``_get_trial`` with NumPy array: regular order
-        dummy = SpikeData(self.data, trialdefinition=self.trl)
-        smp = self.data[:, 0]
-        for trlno, start in enumerate(range(0, self.ns, 5)):
-            idx = np.intersect1d(np.where(smp >= start)[0], np.where(smp < start + 5)[0])
-            trl_ref = self.data[idx, ...]
-            assert np.array_equal(dummy._get_trial(trlno), trl_ref)
-
+        if request.param == "regular":
+            return trl_dummy, _trial_refs(cls.data, 0, cls.ns)
         # test ``_get_trial`` with NumPy array: swapped dimensions
-        dummy = SpikeData(self.data2, trialdefinition=self.trl, dimord=["unit", "channel", "sample"])
-        smp = self.data2[:, -1]
-        for trlno, start in enumerate(range(0, self.ns, 5)):
-            idx = np.intersect1d(np.where(smp >= start)[0], np.where(smp < start + 5)[0])
-            trl_ref = self.data2[idx, ...]
-            assert np.array_equal(dummy._get_trial(trlno), trl_ref)
-
-    def test_str_rep_with_trials(self):
+        dummy = SpikeData(cls.data2, trialdefinition=cls.trl, dimord=["unit", "channel", "sample"])
+        return dummy, _trial_refs(cls.data2, -1, cls.ns)
+
+    @pytest.mark.parametrize("trlno", range(len(trl)))
+    def test_trialretrieval(self, trl_case, trlno):
+        dummy, trl_refs = trl_case
+        assert np.array_equal(dummy._get_trial(trlno), trl_refs[trlno])
+
+    def test_str_rep_with_trials(self, trl_dummy):
         """Test string representation of SpikeData with trialdefinition. Ensure that the bug with the string representation is fixed."""
-        dummy = SpikeData(self.data, trialdefinition=self.trl)
-        assert "samplerate" in str(dummy)
-
-    def test_saveload(self):
-        with tempfile.TemporaryDirectory() as tdir:
-            fname = os.path.join(tdir, "dummy")
-
-            # basic but most important: ensure object integrity is preserved
-            checkAttr = [
-                "channel",
-                "data",
-                "dimord",
-                "sampleinfo",
-                "samplerate",
-                "trialinfo",
-                "unit",
-            ]
-            dummy = SpikeData(self.data, samplerate=10)
-            dummy.save(fname)
-            filename = construct_spy_filename(fname, dummy)
-            # dummy2 = SpikeData(filename)
-            # for attr in checkAttr:
-            #     assert np.array_equal(getattr(dummy, attr), getattr(dummy2, attr))
-            dummy3 = load(fname)
-            for attr in checkAttr:
-                assert np.array_equal(getattr(dummy3, attr), getattr(dummy, attr))
-            save(dummy3, container=os.path.join(tdir, "ymmud"))
-            dummy4 = load(os.path.join(tdir, "ymmud"))
-            for attr in checkAttr:
-                assert np.array_equal(getattr(dummy4, attr), getattr(dummy, attr))
-            del dummy3, dummy4  # avoid PermissionError in Windows
-            time.sleep(0.1)  # wait to kick-off garbage collection
-
-            # overwrite existing container w/new data
-            dummy.samplerate = 20
-            dummy.save()
-            dummy2 = load(filename=filename)
-            assert dummy2.samplerate == 20
-            del dummy, dummy2
-            time.sleep(0.1)  # wait to kick-off garbage collection
-
-            # ensure trialdefinition is saved and loaded correctly
-            dummy = SpikeData(self.data, trialdefinition=self.trl, samplerate=10)
-            dummy.save(fname, overwrite=True)
-            dummy2 = load(filename)
-            assert np.array_equal(dummy.sampleinfo, dummy2.sampleinfo)
-            assert np.array_equal(dummy._t0, dummy2._t0)
-            assert np.array_equal(dummy.trialinfo, dummy2.trialinfo)
-            del dummy, dummy2
-            time.sleep(0.1)  # wait to kick-off garbage collection
-
-            # swap dimensions and ensure `dimord` is preserved
-            dummy = SpikeData(self.data, dimord=["unit", "channel", "sample"], samplerate=10)
-            dummy.save(fname + "_dimswap")
-            filename = construct_spy_filename(fname + "_dimswap", dummy)
-            dummy2 = load(filename)
-            assert dummy2.dimord == dummy.dimord
-            assert dummy2.unit.size == self.num_smp  # swapped
-            assert dummy2.data.shape == dummy.data.shape
-
-            # Delete all open references to file objects b4 closing tmp dir
-            del dummy, dummy2
-            time.sleep(0.1)
+        assert "samplerate" in str(trl_dummy)
+
+    def test_saveload(self, tdir, request):
+        # containers are prefixed w/the test name to not collide in the shared `tdir`
+        prefix = os.path.join(tdir, request.node.name)
+        fname = prefix + "_dummy"
+
+        # basic but most important: ensure object integrity is preserved
+        checkAttr = [
+            "channel",
+            "data",
+            "dimord",
+            "sampleinfo",
+            "samplerate",
+            "trialinfo",
+            "unit",
+        ]
+        dummy = SpikeData(self.data, samplerate=10)
+        dummy3 = _assert_roundtrip(dummy, fname, checkAttr)
+        filename = dummy3.filename
+        dummy4 = _assert_roundtrip(dummy3, prefix + "_ymmud", checkAttr)
+        for obj in (dummy3, dummy4):
+            obj._close()
+        del dummy3, dummy4
+
+        # overwrite existing container w/new data
+        dummy.samplerate = 20
+        dummy.save()
+        dummy2 = load(filename=filename)
+        assert dummy2.samplerate == 20
+        for obj in (dummy, dummy2):
+            obj._close()
+        del dummy, dummy2
+
+        # ensure trialdefinition is saved and loaded correctly
+        dummy = SpikeData(self.data, trialdefinition=self.trl, samplerate=10)
+        dummy2 = _assert_roundtrip(dummy, fname, ["sampleinfo", "_t0", "trialinfo"], overwrite=True)
+        for obj in (dummy, dummy2):
+            obj._close()
+        del dummy, dummy2
+
+        # swap dimensions and ensure `dimord` is preserved
+        dummy = SpikeData(self.data, dimord=["unit", "channel", "sample"], samplerate=10)
+        dummy2 = _assert_roundtrip(dummy, fname + "_dimswap", ["dimord"])
+        assert dummy2.unit.size == self.num_smp  # swapped
+        assert dummy2.data.shape == dummy.data.shape
+
+        # Release the backing files explicitly instead of waiting for garbage collection
+        for obj in (dummy, dummy2):
+            obj._close()
+        del dummy, dummy2
+
+    def test_save_single_file_open(self, tdir, request, monkeypatch):
+        """Overwriting a container truncates and writes its HDF5 file in one go"""
+        fname = os.path.join(tdir, request.node.name)
+        dummy = SpikeData(self.data, samplerate=10)
+        dummy.save(fname)
+        dummy._close()
+
+        writeOpens = []
+
+        class CountingFile(h5py.File):
+            def __init__(self, name, mode="r", *args, **kwargs):
+                if mode == "w":
+                    writeOpens.append(name)
+                super().__init__(name, mode, *args, **kwargs)
+
+        dummy2 = SpikeData(self.data, samplerate=20)
+        monkeypatch.setattr(h5py, "File", CountingFile)
+        dummy2.save(fname, overwrite=True)
+        monkeypatch.undo()
+        assert len(writeOpens) == 1
+        dummy3 = load(fname)
+        assert dummy3.samplerate == 20
+        for obj in (dummy2, dummy3):
+            obj._close()
+        del dummy2, dummy3
 
 
 class TestEventData:
@@ -218,26 +273,30 @@ class TestEventData:
     # Allocate test-datasets
     nc = 10
     ns = 30
-    data = np.vstack([np.arange(0, ns, 5), np.zeros((int(ns / 5),))]).T.astype(int)
+    data = np.zeros((int(ns / 5), 2), dtype=int)
+    data[:, 0] = np.arange(0, ns, 5)
     data[1::2, 1] = 1
     data2 = data.copy()
     data2[:, -1] = data[:, 0]
     data2[:, 0] = data[:, -1]
-    data3 = np.hstack([data2, data2])
-    trl = np.vstack(
-        [
-            np.arange(0, ns, 5),
-            np.arange(5, ns + 5, 5),
-            np.ones((int(ns / 5),)),
-            np.ones((int(ns / 5),)) * np.pi,
-        ]
-    ).T
-    num_smp = np.unique(data[:, 0]).size
-    num_evt = np.unique(data[:, 1]).size
+    data3 = _dup_cols(data2)
+    trl = np.empty((int(ns / 5), 4))
+    trl[:, 0] = np.arange(0, ns, 5)
+    trl[:, 1] = np.arange(5, ns + 5, 5)
+    trl[:, 2] = 1
+    trl[:, 3] = np.pi
+    num_smp = int(np.count_nonzero(np.bincount(data[:, 0])))
+    num_evt = int(np.count_nonzero(np.bincount(data[:, 1])))
     customDimord = ["sample", "eventid", "custom1", "custom2"]
 
     adata = np.arange(1, nc * ns + 1).reshape(ns, nc)
 
+    # trial-defined objects are only read by the tests, so build them once
+    @pytest.fixture(scope="class")
+    @classmethod
+    def trl_dummy(cls):
+        return EventData(cls.data, trialdefinition=cls.trl)
+
     def test_ed_empty(self):
         dummy = EventData()
         assert len(dummy.cfg) == 0
@@ -266,102 +325,85 @@ class TestEventData:
         assert not edata._is_empty()
         edata._register_dataset("blah", np.zeros((3, 3), dtype=float))
 
-    def test_str_rep_with_trials(self):
+    def test_str_rep_with_trials(self, trl_dummy):
         """Test string representation of EventData with trialdefinition. Ensure that the bug with the string representation is fixed."""
-        dummy = EventData(self.data, trialdefinition=self.trl)
-        assert "samplerate" in str(dummy)  # The real test is that 'str(dummy)' does not raise an error.
+        assert "samplerate" in str(trl_dummy)  # The real test is that 'str(dummy)' does not raise an error.
 
-    def test_ed_trialretrieval(self):
+    @pytest.fixture(scope="class", params=["regular", "swapped", "custom"])
+    @classmethod
+    def trl_case(cls, request, trl_dummy):
         # test ``_get_trial`` with NumPy array: regular order
-        dummy = EventData(self.data, trialdefinition=self.trl)
-        smp = self.data[:, 0]
-        for trlno, start in enumerate(range(0, self.ns, 5)):
-            idx = np.intersect1d(np.where(smp >= start)[0], np.where(smp < start + 5)[0])
-            trl_ref = self.data[idx, ...]
-            assert np.array_equal(dummy._get_trial(trlno), trl_ref)
-
+        if request.param == "regular":
+            return trl_dummy, _trial_refs(cls.data, 0, cls.ns)
         # test `_get_trial` with NumPy array: swapped dimensions
-        dummy = EventData(self.data2, trialdefinition=self.trl, dimord=["eventid", "sample"])
-        smp = self.data2[:, -1]
-        for trlno, start in enumerate(range(0, self.ns, 5)):
-            idx = np.intersect1d(np.where(smp >= start)[0], np.where(smp < start + 5)[0])
-            trl_ref = self.data2[idx, ...]
-            assert np.array_equal(dummy._get_trial(trlno), trl_ref)
-
+        if request.param == "swapped":
+            dummy = EventData(cls.data2, trialdefinition=cls.trl, dimord=["eventid", "sample"])
+            return dummy, _trial_refs(cls.data2, -1, cls.ns)
         # test `_get_trial` with NumPy array: customized columns names
         nuDimord = ["eventid", "sample", "custom1", "custom2"]
-        dummy = EventData(self.data3, trialdefinition=self.trl, dimord=nuDimord)
+        dummy = EventData(cls.data3, trialdefinition=cls.trl, dimord=nuDimord)
         assert dummy.dimord == nuDimord
-        smp = self.data3[:, -1]
-        for trlno, start in enumerate(range(0, self.ns, 5)):
-            idx = np.intersect1d(np.where(smp >= start)[0], np.where(smp < start + 5)[0])
-            trl_ref = self.data3[idx, ...]
-            assert np.array_equal(dummy._get_trial(trlno), trl_ref)
-
-    def test_ed_saveload(self):
-        with tempfile.TemporaryDirectory() as tdir:
-            fname = os.path.join(tdir, "dummy")
-
-            # basic but most important: ensure object integrity is preserved
-            checkAttr = ["data", "dimord", "sampleinfo", "samplerate", "trialinfo"]
-            dummy = EventData(self.data, samplerate=10)
-            dummy.save(fname)
-            filename = construct_spy_filename(fname, dummy)
-            dummy2 = load(filename)
-            for attr in checkAttr:
-                assert np.array_equal(getattr(dummy, attr), getattr(dummy2, attr))
-            dummy3 = load(fname)
-            for attr in checkAttr:
-                assert np.array_equal(getattr(dummy3, attr), getattr(dummy, attr))
-            save(dummy3, container=os.path.join(tdir, "ymmud"))
-            dummy4 = load(os.path.join(tdir, "ymmud"))
-            for attr in checkAttr:
-                assert np.array_equal(getattr(dummy4, attr), getattr(dummy, attr))
-            del dummy2, dummy3, dummy4  # avoid PermissionError in Windows
-
-            # overwrite existing file w/new data
-            dummy.samplerate = 20
-            dummy.save()
-            dummy2 = load(filename=filename)
-            assert dummy2.samplerate == 20
-            del dummy, dummy2
-            time.sleep(0.1)  # wait to kick-off garbage collection
-
-            # ensure trialdefinition is saved and loaded correctly
-            dummy = EventData(self.data, trialdefinition=self.trl, samplerate=10)
-            dummy.save(fname, overwrite=True)
-            dummy2 = load(filename)
-            assert np.array_equal(dummy.sampleinfo, dummy2.sampleinfo)
-            assert np.array_equal(dummy._t0, dummy2._t0)
-            assert np.array_equal(dummy.trialinfo, dummy2.trialinfo)
-            del dummy, dummy2
-
-            # swap dimensions and ensure `dimord` is preserved
-            dummy = EventData(self.data, dimord=["eventid", "sample"], samplerate=10)
-            dummy.save(fname + "_dimswap")
-            filename = construct_spy_filename(fname + "_dimswap", dummy)
-            dummy2 = load(filename)
-            assert dummy2.dimord == dummy.dimord
-            assert dummy2.eventid.size == self.num_smp  # swapped
-            assert dummy2.data.shape == dummy.data.shape
-            del dummy, dummy2
-
-            # save dataset w/custom column names and ensure `dimord` is preserved
-            dummy = EventData(
-                np.hstack([self.data, self.data]),
-                dimord=self.customDimord,
-                samplerate=10,
-            )
-            dummy.save(fname + "_customDimord")
-            filename = construct_spy_filename(fname + "_customDimord", dummy)
-            dummy2 = load(filename)
-            assert dummy2.dimord == dummy.dimord
-            assert dummy2.eventid.size == self.num_evt
-            assert dummy2.data.shape == dummy.data.shape
+        return dummy, _trial_refs(cls.data3, -1, cls.ns)
+
+    @pytest.mark.parametrize("trlno", range(len(trl)))
+    def test_ed_trialretrieval(self, trl_case, trlno):
+        dummy, trl_refs = trl_case
+        assert np.array_equal(dummy._get_trial(trlno), trl_refs[trlno])
+
+    def test_ed_saveload(self, tdir, request):
+        # containers are prefixed w/the test name to not collide in the shared `tdir`
+        prefix = os.path.join(tdir, request.node.name)
+        fname = prefix + "_dummy"
+
+        # basic but most important: ensure object integrity is preserved
+        checkAttr = ["data", "dimord", "sampleinfo", "samplerate", "trialinfo"]
+        dummy = EventData(self.data, samplerate=10)
+        dummy3 = _assert_roundtrip(dummy, fname, checkAttr)
+        filename = dummy3.filename
+        dummy4 = _assert_roundtrip(dummy3, prefix + "_ymmud", checkAttr)
+        for obj in (dummy3, dummy4):
+            obj._close()
+        del dummy3, dummy4
+
+        # overwrite existing file w/new data
+        dummy.samplerate = 20
+        dummy.save()
+        dummy2 = load(filename=filename)
+        assert dummy2.samplerate == 20
+        for obj in (dummy, dummy2):
+            obj._close()
+        del dummy, dummy2
+
+        # ensure trialdefinition is saved and loaded correctly
+        dummy = EventData(self.data, trialdefinition=self.trl, samplerate=10)
+        dummy2 = _assert_roundtrip(dummy, fname, ["sampleinfo", "_t0", "trialinfo"], overwrite=True)
+        for obj in (dummy, dummy2):
+            obj._close()
+        del dummy, dummy2
+
+        # swap dimensions and ensure `dimord` is preserved
+        dummy = EventData(self.data, dimord=["eventid", "sample"], samplerate=10)
+        dummy2 = _assert_roundtrip(dummy, fname + "_dimswap", ["dimord"])
+        assert dummy2.eventid.size == self.num_smp  # swapped
+        assert dummy2.data.shape == dummy.data.shape
+        for obj in (dummy, dummy2):
+            obj._close()
+        del dummy, dummy2
+
+        # save dataset w/custom column names and ensure `dimord` is preserved
+        dummy = EventData(
+            _dup_cols(self.data),
+            dimord=self.customDimord,
+            samplerate=10,
+        )
+        dummy2 = _assert_roundtrip(dummy, fname + "_customDimord", ["dimord"])
+        assert dummy2.eventid.size == self.num_evt
+        assert dummy2.data.shape == dummy.data.shape
 
-            # Delete all open references to file objects b4 closing tmp dir
-            del dummy, dummy2
-            time.sleep(0.1)
+        # Release the backing files explicitly instead of waiting for garbage collection
+        for obj in (dummy, dummy2):
+            obj._close()
+        del dummy, dummy2
 
     def test_ed_trialsetting(self):
 
@@ -370,10 +412,10 @@ class TestEventData:
         sr_a = 1
         pre = 2
         post = 1
-        msk = self.data[:, 1] == 1
-        sinfo = np.vstack([self.data[msk, 0] / sr_e - pre, self.data[msk, 0] / sr_e + post]).T
-        sinfo_e = np.round(sinfo * sr_e).astype(int)
-        sinfo_a = np.round(sinfo * sr_a).astype(int)
+        trg = self.data[self.data[:, 1] == 1, 0]
+        # integer trigger samples: pre/post in samples need no rounding at the EventData rate
+        sinfo_e = np.column_stack([trg - pre * sr_e, trg + post * sr_e])
+        sinfo_a = np.round(np.column_stack([trg / sr_e - pre, trg / sr_e + post]) * sr_a).astype(int)
 
         # Compute sampleinfo w/pre, post and trigger
         evt_dummy = EventData(self.data, samplerate=sr_e)
@@ -395,8 +437,8 @@ class TestEventData:
         samples = np.arange(0, int(self.ns / 3), 3)[1:]
         dappend = np.vstack([samples, np.full(samples.shape, 2)]).T
         data3 = np.vstack([self.data, dappend])
-        data3 = np.hstack([data3, data3])
-        idx = np.argsort(data3[:, 0])
+        data3 = _dup_cols(data3)
+        idx = np.argsort(data3[:, 0], kind="stable")
         data3 = data3[idx, :]
         evt_dummy = EventData(data3, dimord=self.customDimord, samplerate=sr_e)
         evt_dummy.definetrial(start=0, stop=1)
@@ -406,26 +448,25 @@ class TestEventData:
         starts = [2, 2, 1]
         stops = [1, 2, 0]
         sinfo3 = np.empty((3, 2))
-        dsamps = list(data3[:, 0])
-        dcodes = list(data3[:, 1])
+        dsamps = data3[:, 0]
+        dcodes = data3[:, 1]
+        # `pos` points past the last consumed event, look for the next match from there
+        pos = 0
         for sk, (start, stop) in enumerate(zip(starts, stops)):
-            idx = dcodes.index(start)
-            start = dsamps[idx]
-            dcodes = dcodes[idx + 1 :]
-            dsamps = dsamps[idx + 1 :]
-            idx = dcodes.index(stop)
-            stop = dsamps[idx]
-            dcodes = dcodes[idx + 1 :]
-            dsamps = dsamps[idx + 1 :]
-            sinfo3[sk, :] = [start, stop]
+            istart = pos + int(np.argmax(dcodes[pos:] == start))
+            pos = istart + 1
+            istop = pos + int(np.argmax(dcodes[pos:] == stop))
+            pos = istop + 1
+            sinfo3[sk, :] = [dsamps[istart], dsamps[istop]]
         evt_dummy = EventData(data3, dimord=self.customDimord, samplerate=sr_e)
         evt_dummy.definetrial(start=[2, 2, 1], stop=[1, 2, 0])
         assert np.array_equal(evt_dummy.sampleinfo, sinfo3)
 
-        # Attach computed sampleinfo to AnalogData (data and data3 must yield identical results)
+        # Attach computed sampleinfo to AnalogData (data and data3 must yield identical results),
+        # `definetrial` re-attaches trials, so a single AnalogData object serves all cases
+        ang_dummy = AnalogData(self.adata, samplerate=sr_a)
         evt_dummy = EventData(data=self.data, samplerate=sr_e)
         evt_dummy.definetrial(pre=pre, post=post, trigger=1)
-        ang_dummy = AnalogData(self.adata, samplerate=sr_a)
         ang_dummy.definetrial(evt_dummy)
         assert np.array_equal(ang_dummy.sampleinfo, sinfo_a)
         evt_dummy = EventData(data=data3, dimord=self.customDimord, samplerate=sr_e)
@@ -433,13 +474,14 @@ class TestEventData:
         ang_dummy.definetrial(evt_dummy)
         assert np.array_equal(ang_dummy.sampleinfo, sinfo_a)
 
-        # Compute and attach sampleinfo on the fly
+        # Compute and attach sampleinfo on the fly (reset to a single trial in between
+        # to not simply re-read the previous result)
+        ang_dummy.definetrial()
         evt_dummy = EventData(data=self.data, samplerate=sr_e)
-        ang_dummy = AnalogData(self.adata, samplerate=sr_a)
         ang_dummy.definetrial(evt_dummy, pre=pre, post=post, trigger=1)
         assert np.array_equal(ang_dummy.sampleinfo, sinfo_a)
+        ang_dummy.definetrial()
         evt_dummy = EventData(data=data3, dimord=self.customDimord, samplerate=sr_e)
-        ang_dummy = AnalogData(self.adata, samplerate=sr_a)
         ang_dummy.definetrial(evt_dummy, pre=pre, post=post, trigger=1)
         assert np.array_equal(ang_dummy.sampleinfo, sinfo_a)
 
@@ -451,7 +493,7 @@ class TestEventData:
             ]
         ).T.astype(int)
         smp[1::2, 1] = 1
-        smp = np.hstack([smp, smp])
+        smp = _dup_cols(smp)
         data4 = np.vstack([data3, smp])
         evt_dummy = EventData(data=data4, dimord=self.customDimord, samplerate=sr_e)
         evt_dummy.definetrial(pre=pre, post=post, trigger=1)
@@ -468,20 +510,28 @@ class TestEventData:
         ang_dummy.definetrial(evt_dummy, clip_edges=True)
         assert ang_dummy.sampleinfo[-1, 1] == self.ns
 
-        # Check both pre/start and/or post/stop being None
-        evt_dummy = EventData(data=self.data, samplerate=sr_e)
-        with pytest.raises(SPYValueError):
-            evt_dummy.definetrial(trigger=1, post=post)
-        with pytest.raises(SPYValueError):
-            evt_dummy.definetrial(pre=pre, trigger=1)
-        with pytest.raises(SPYValueError):
-            evt_dummy.definetrial(start=0)
-        with pytest.raises(SPYValueError):
-            evt_dummy.definetrial(stop=1)
-        with pytest.raises(SPYValueError):
-            evt_dummy.definetrial(trigger=1)
+    # Check both pre/start and/or post/stop being None
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            dict(trigger=1, post=1),
+            dict(pre=2, trigger=1),
+            dict(start=0),
+            dict(stop=1),
+            dict(trigger=1),
+            dict(pre=2, post=1),
+        ],
+    )
+    def test_ed_trialsetting_invalid_kwargs(self, kwargs):
+        evt_dummy = EventData(data=self.data, samplerate=2)
         with pytest.raises(SPYValueError):
-            evt_dummy.definetrial(pre=pre, post=post)
+            evt_dummy.definetrial(**kwargs)
+
+    def test_ed_trialsetting_incomplete(self):
+        sr_e = 2
+        sr_a = 1
+        pre = 2
+        post = 1
 
         # Try to define trials w/o samplerate set
         evt_dummy = EventData(data=self.data)
@@ -603,7 +653,7 @@ class TestWaveform:
         tfile1 = tempfile.NamedTemporaryFile(suffix=".spike", delete=True)
         tfile1.close()
         tmp_spy_filename = tfile1.name
-        save(spiked, filename=tmp_spy_filename)
+        spiked.save(filename=tmp_spy_filename)
         assert "waveform" in h5py.File(tmp_spy_filename, mode="r").keys()
         spkd2 = load(filename=tmp_spy_filename)
         assert isinstance(spkd2.waveform, h5py.Dataset), f"Expected h5py.Dataset, got {type(spkd2.waveform)}"
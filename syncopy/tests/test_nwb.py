@@ -125,8 +125,6 @@ class TestNWBExporter:
             outpath = os.path.join(tdir, "test_save_analog2nwb0.nwb")
             adata.save_nwb(outpath=outpath, with_trialdefinition=False)
 
-            adata.save_nwb(outpath="adata_no_trials_64chan.nwb", with_trialdefinition=False)
-
             if self.do_validate_NWB:
                 is_valid, err = _is_valid_nwb_file(outpath)
                 assert is_valid, f"Exported NWB file failed validation: {err}"
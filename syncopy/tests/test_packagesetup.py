@@ -116,3 +116,15 @@ def test_cleanup():
     del os.environ["SPYTMPDIR"]
     time.sleep(1)
     shutil.rmtree(tmpDir)
+
+
+# check if lazily exposed names match the public API of their sub-packages
+def test_lazy_submodules():
+    for submod, names in syncopy._submodules.items():
+        module = importlib.import_module("syncopy." + submod)
+        assert sorted(names) == sorted(module.__all__)
+        for name in names:
+            assert getattr(syncopy, name) is getattr(module, name)
+            assert name in dir(syncopy)
+    with pytest.raises(AttributeError):
+        syncopy.not_a_syncopy_function
@@ -18,7 +18,7 @@ from syncopy import freqanalysis, selectdata
 from syncopy.shared.errors import SPYValueError, SPYError
 from syncopy.datatype.selector import Selector
 from syncopy.datatype import AnalogData, SpectralData
-from syncopy.shared.tools import StructDict, get_defaults
+from syncopy.shared.tools import StructDict, get_defaults, best_match
 
 # Decorator to decide whether or not to run memory-intensive tests
 availMem = psutil.virtual_memory().total
@@ -363,6 +363,18 @@ class TestMTMFFT:
             )
             assert np.all(spec.freq == foi)
 
+    def test_foi_matching(self):
+        # `foi` is snapped to the FFT grid exactly like `best_match` does it,
+        # incl. floating point ties: df = 0.4Hz and 99Hz lies "between"
+        # 98.8Hz and 99.2Hz, yet is (numerically) closer to 98.8Hz
+        nSamples, fs = 500, 200
+        adata = AnalogData(data=np.ones((nSamples, 2)), samplerate=fs)
+        foi = np.array([99, 0.2, 50.2, 12.61, 99.8])
+        spec = freqanalysis(adata, method="mtmfft", taper="hann", foi=foi)
+        ref, _ = best_match(np.fft.rfftfreq(nSamples, 1 / fs), foi, squash_duplicates=True)
+        assert np.array_equal(spec.freq, ref)
+        assert np.isclose(spec.freq[0], 98.8)
+
     def test_dpss(self):
 
         for select in self.sigdataSelections:
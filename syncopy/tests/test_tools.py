@@ -249,5 +249,18 @@ def test_serializable_dict():
     with pytest.raises(SPYError, match="Wrong type of key"):
         dct[np.int64(12)] = 'some_string'
 
+
+def test_nextpow2():
+    from syncopy.shared.input_processors import _nextpow2
+
+    assert _nextpow2(0) == 1
+    assert _nextpow2(1) == 1
+    assert _nextpow2(2) == 2
+    assert _nextpow2(3) == 4
+    assert _nextpow2(4.5) == 8
+    assert _nextpow2(np.int64(1000)) == 1024
+    assert _nextpow2(1025) == 2048
+
+
 if __name__ == "__main__":
     T1 = TestTools()